@@ -1,31 +1,74 @@
 import sys
 import winreg
-import subprocess
 import json
 import time
+import base64
+import threading
 import os
+import shutil
 import datetime
-from typing import List, Optional
-from dataclasses import dataclass
+import ctypes
+import logging
+from ctypes import wintypes
+from functools import cache
+from typing import TYPE_CHECKING, Callable, List, Optional
+from dataclasses import asdict, dataclass, replace
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QWidget,
-    QLabel, QLineEdit, QPushButton, QTableWidget, QTableWidgetItem,
+    QLabel, QLineEdit, QPushButton, QTableView,
     QMessageBox, QHeaderView, QGroupBox, QProgressBar,
     QSplashScreen, QToolBar, QDialog, QTextEdit, QCheckBox, QProgressDialog
 )
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont, QColor, QPixmap, QPainter, QAction, QIcon
+from PySide6.QtCore import (
+    Qt, QThread, Signal, QTimer, QObject, QRunnable, QThreadPool, QSemaphore,
+    QAbstractTableModel, QModelIndex, QSettings, QElapsedTimer, QEventLoop, QFile, QIODevice
+)
+from PySide6.QtGui import QFont, QColor, QPixmap, QPainter, QAction, QIcon, QImage, QTextDocument
 
 import resources  #:noqa: F401
 
+if TYPE_CHECKING:
+    import queue
+
+log = logging.getLogger(__name__)
 
-startupinfo = None
-if sys.platform == "win32":
+
+@cache
+def get_startupinfo():
+    """Returns the STARTUPINFO used for PowerShell processes, None outside Windows"""
+    if sys.platform != "win32":
+        return None
+    import subprocess
     startupinfo = subprocess.STARTUPINFO()
     startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+    return startupinfo
+
+
+def get_creationflags() -> int:
+    """Returns CREATE_NO_WINDOW so PowerShell runs without a console, 0 outside Windows"""
+    if sys.platform != "win32":
+        return 0
+    import subprocess
+    return subprocess.CREATE_NO_WINDOW
+
+
+@cache
+def get_powershell_executable() -> str:
+    """Returns PowerShell 7 (pwsh) if installed, otherwise Windows PowerShell"""
+    return shutil.which("pwsh") or "powershell"
+
 
+def powershell_args(command: str) -> List[str]:
+    """Builds the argument list to run a PowerShell command without loading user profiles"""
+    # -EncodedCommand takes base64 of UTF-16LE and avoids quoting issues with -Command
+    encoded_command = base64.b64encode(command.encode('utf-16-le')).decode('ascii')
+    return [
+        get_powershell_executable(), "-NoLogo", "-NoProfile", "-NonInteractive",
+        "-ExecutionPolicy", "Bypass", "-EncodedCommand", encoded_command
+    ]
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class CameraDevice:
     """Data class for USB camera information"""
     name: str
@@ -36,6 +79,449 @@ class CameraDevice:
     is_connected: bool = True
 
 
+# Device setup classes that contain cameras
+GUID_DEVCLASS_CAMERA = "{ca3e7ab9-b4c3-4ae6-8251-579ef933890f}"
+GUID_DEVCLASS_IMAGE = "{6bdd1fc6-810f-11d0-bec7-08002be2092f}"
+CAMERA_CLASS_GUIDS = (GUID_DEVCLASS_CAMERA, GUID_DEVCLASS_IMAGE)
+
+# SetupAPI / CfgMgr32 constants
+DIGCF_PRESENT = 0x00000002
+SPDRP_DEVICEDESC = 0x00000000
+SPDRP_HARDWAREID = 0x00000001
+SPDRP_FRIENDLYNAME = 0x0000000C
+ERROR_INSUFFICIENT_BUFFER = 122
+ERROR_NO_MORE_ITEMS = 259
+CR_SUCCESS = 0
+DN_HAS_PROBLEM = 0x00000400
+CM_GETIDLIST_FILTER_PRESENT = 0x00000100
+CM_GETIDLIST_FILTER_CLASS = 0x00000200
+DIF_PROPERTYCHANGE = 0x00000012
+DICS_PROPCHANGE = 0x00000003
+DICS_FLAG_GLOBAL = 0x00000001
+DI_NEEDRESTART = 0x00000080
+DI_NEEDREBOOT = 0x00000100
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+# Device change notifications
+WM_DEVICECHANGE = 0x0219
+DBT_DEVICEARRIVAL = 0x8000
+DBT_DEVICEREMOVECOMPLETE = 0x8004
+DBT_DEVTYP_DEVICEINTERFACE = 0x00000005
+DEVICE_NOTIFY_WINDOW_HANDLE = 0x00000000
+KSCATEGORY_VIDEO_CAMERA = "{e5323777-f976-4f5b-9b55-b94699c46e44}"
+
+# Device interface classes below DeviceClasses that camera interfaces are registered in
+DEVICE_CLASSES_PATH = r"SYSTEM\CurrentControlSet\Control\DeviceClasses"
+CAMERA_INTERFACE_CLASS_GUIDS = (
+    "{65e8773d-8f56-11d0-a3b9-00a0c9223196}",  # KSCATEGORY_CAPTURE
+    KSCATEGORY_VIDEO_CAMERA,                   # KSCATEGORY_VIDEO_CAMERA
+    "{6994AD05-93EF-11D0-A3CC-00A0C9223196}",  # KSCATEGORY_VIDEO
+)
+
+# Wider set of DeviceClasses GUIDs scanned by the enhanced registry search
+DEVICE_CLASSES_SEARCH_GUIDS = CAMERA_INTERFACE_CLASS_GUIDS + (
+    "{4D36E96C-E325-11CE-BFC1-08002BE10318}",  # Sound/Video devices
+    "{6bdd1fc6-810f-11d0-bec7-08002be2092f}",  # USB devices
+    "{4d36e972-e325-11ce-bfc1-08002be10318}",  # Multimedia devices
+    "{c06ff265-ae09-48f0-812c-16753d7cba83}",  # WDM streaming devices
+    "{6994ad04-93ef-11d0-a3cc-00a0c9223196}",  # Still image devices
+)
+
+# 32-bit Python must ask for the 64-bit registry view, in 64-bit Python it is the default
+REGISTRY_VIEW_FLAG = winreg.KEY_WOW64_64KEY if ctypes.sizeof(ctypes.c_void_p) == 4 else 0
+
+# PnP device status reported by PowerShell for a working device
+_OK = 'OK'
+
+# The splash is only shown if creating and showing the main window took at least
+# this long (ms) on the previous start
+SPLASH_MIN_STARTUP_MS = 150
+
+SPLASH_WIDTH = 450
+SPLASH_HEIGHT = 300
+
+# Splash text, sizes match the original drawText calls
+SPLASH_STYLESHEET = """
+h1 { font-size: 26pt; font-weight: bold; margin-bottom: 14px; }
+h3 { font-size: 14pt; font-weight: normal; margin-bottom: 36px; }
+p { font-size: 12pt; }
+"""
+SPLASH_HTML = """
+<div align="center" style="color: #ffffff;">
+<h1>🎥 CamRenamer</h1>
+<h3>USB Camera Manager v{version}</h3>
+<p>Loading...</p>
+</div>
+"""
+
+# Cached scans are discarded when the boot time differs by more than this (seconds)
+SCAN_CACHE_BOOT_TOLERANCE = 60
+
+# Automatic rescans within this many seconds of the last scan reuse its result
+SCAN_CACHE_TTL = 5.0
+
+# IDs longer than this are shortened in the camera table (full text in the tooltip)
+DEVICE_ID_DISPLAY_LENGTH = 50
+HARDWARE_ID_DISPLAY_LENGTH = 30
+
+# Delay (ms) between a camera being plugged/unplugged and the automatic rescan,
+# restarted by every further notification so a burst triggers one scan
+DEVICE_CHANGE_RESCAN_DELAY_MS = 200
+
+# Emit a progress update after every N enumerated devices
+SCAN_PROGRESS_STEP = 4
+
+# The PowerShell scan reports no progress of its own. Its progress is estimated from
+# the median of the last SCAN_DURATION_HISTORY durations, updated SCAN_ESTIMATE_STEPS
+# times per expected scan and never shown above SCAN_ESTIMATE_MAX percent
+SCAN_DURATION_HISTORY = 10
+SCAN_ESTIMATE_STEPS = 4
+SCAN_ESTIMATE_MAX = 95
+
+
+class GUID(ctypes.Structure):
+    """Win32 GUID structure"""
+    _fields_ = [
+        ("Data1", wintypes.DWORD),
+        ("Data2", wintypes.WORD),
+        ("Data3", wintypes.WORD),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+    @classmethod
+    def from_string(cls, value: str) -> "GUID":
+        """Creates a GUID from its '{xxxxxxxx-...}' string form"""
+        import uuid
+        return cls.from_buffer_copy(uuid.UUID(value).bytes_le)
+
+
+class SP_DEVINFO_DATA(ctypes.Structure):
+    """SetupAPI device information element"""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("ClassGuid", GUID),
+        ("DevInst", wintypes.DWORD),
+        ("Reserved", ctypes.c_void_p),
+    ]
+
+
+class SP_CLASSINSTALL_HEADER(ctypes.Structure):
+    """Header of the class installer parameters"""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("InstallFunction", wintypes.DWORD),
+    ]
+
+
+class SP_PROPCHANGE_PARAMS(ctypes.Structure):
+    """Class installer parameters of DIF_PROPERTYCHANGE"""
+    _fields_ = [
+        ("ClassInstallHeader", SP_CLASSINSTALL_HEADER),
+        ("StateChange", wintypes.DWORD),
+        ("Scope", wintypes.DWORD),
+        ("HwProfile", wintypes.DWORD),
+    ]
+
+
+class SP_DEVINSTALL_PARAMS_W(ctypes.Structure):
+    """Device installation parameters, Flags reports whether a reboot is needed"""
+    _fields_ = [
+        ("cbSize", wintypes.DWORD),
+        ("Flags", wintypes.DWORD),
+        ("FlagsEx", wintypes.DWORD),
+        ("hwndParent", wintypes.HWND),
+        ("InstallMsgHandler", ctypes.c_void_p),
+        ("InstallMsgHandlerContext", ctypes.c_void_p),
+        ("FileQueue", ctypes.c_void_p),
+        ("ClassInstallReserved", ctypes.c_size_t),
+        ("Reserved", wintypes.DWORD),
+        ("DriverPath", ctypes.c_wchar * 260),
+    ]
+
+
+class DEV_BROADCAST_DEVICEINTERFACE_W(ctypes.Structure):
+    """Filter for RegisterDeviceNotificationW"""
+    _fields_ = [
+        ("dbcc_size", wintypes.DWORD),
+        ("dbcc_devicetype", wintypes.DWORD),
+        ("dbcc_reserved", wintypes.DWORD),
+        ("dbcc_classguid", GUID),
+        ("dbcc_name", ctypes.c_wchar * 1),
+    ]
+
+
+@cache
+def load_setupapi():
+    """Loads setupapi.dll and cfgmgr32.dll with typed function prototypes"""
+    if sys.platform != "win32":
+        raise OSError("SetupAPI is only available on Windows")
+
+    setupapi = ctypes.WinDLL("setupapi", use_last_error=True)
+    cfgmgr32 = ctypes.WinDLL("cfgmgr32", use_last_error=True)
+
+    setupapi.SetupDiGetClassDevsW.argtypes = [ctypes.POINTER(GUID), wintypes.LPCWSTR, wintypes.HWND, wintypes.DWORD]
+    setupapi.SetupDiGetClassDevsW.restype = wintypes.HANDLE
+    setupapi.SetupDiEnumDeviceInfo.argtypes = [wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(SP_DEVINFO_DATA)]
+    setupapi.SetupDiEnumDeviceInfo.restype = wintypes.BOOL
+    setupapi.SetupDiGetDeviceRegistryPropertyW.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA), wintypes.DWORD,
+        ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)
+    ]
+    setupapi.SetupDiGetDeviceRegistryPropertyW.restype = wintypes.BOOL
+    setupapi.SetupDiGetDeviceInstanceIdW.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA), wintypes.LPWSTR, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD)
+    ]
+    setupapi.SetupDiGetDeviceInstanceIdW.restype = wintypes.BOOL
+    setupapi.SetupDiDestroyDeviceInfoList.argtypes = [wintypes.HANDLE]
+    setupapi.SetupDiDestroyDeviceInfoList.restype = wintypes.BOOL
+    setupapi.SetupDiCreateDeviceInfoList.argtypes = [ctypes.POINTER(GUID), wintypes.HWND]
+    setupapi.SetupDiCreateDeviceInfoList.restype = wintypes.HANDLE
+    setupapi.SetupDiOpenDeviceInfoW.argtypes = [
+        wintypes.HANDLE, wintypes.LPCWSTR, wintypes.HWND, wintypes.DWORD, ctypes.POINTER(SP_DEVINFO_DATA)
+    ]
+    setupapi.SetupDiOpenDeviceInfoW.restype = wintypes.BOOL
+    setupapi.SetupDiSetClassInstallParamsW.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA), ctypes.POINTER(SP_CLASSINSTALL_HEADER), wintypes.DWORD
+    ]
+    setupapi.SetupDiSetClassInstallParamsW.restype = wintypes.BOOL
+    setupapi.SetupDiCallClassInstaller.argtypes = [wintypes.DWORD, wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA)]
+    setupapi.SetupDiCallClassInstaller.restype = wintypes.BOOL
+    setupapi.SetupDiGetDeviceInstallParamsW.argtypes = [
+        wintypes.HANDLE, ctypes.POINTER(SP_DEVINFO_DATA), ctypes.POINTER(SP_DEVINSTALL_PARAMS_W)
+    ]
+    setupapi.SetupDiGetDeviceInstallParamsW.restype = wintypes.BOOL
+
+    cfgmgr32.CM_Get_DevNode_Status.argtypes = [
+        ctypes.POINTER(wintypes.ULONG), ctypes.POINTER(wintypes.ULONG), wintypes.DWORD, wintypes.ULONG
+    ]
+    cfgmgr32.CM_Get_DevNode_Status.restype = wintypes.DWORD
+    cfgmgr32.CM_Get_Device_ID_List_SizeW.argtypes = [ctypes.POINTER(wintypes.ULONG), wintypes.LPCWSTR, wintypes.ULONG]
+    cfgmgr32.CM_Get_Device_ID_List_SizeW.restype = wintypes.DWORD
+    cfgmgr32.CM_Get_Device_ID_ListW.argtypes = [wintypes.LPCWSTR, wintypes.LPWSTR, wintypes.ULONG, wintypes.ULONG]
+    cfgmgr32.CM_Get_Device_ID_ListW.restype = wintypes.DWORD
+
+    return setupapi, cfgmgr32
+
+
+def get_camera_device_ids() -> List[str]:
+    """Returns the instance IDs of all present camera/image devices (cheap, no property reads)"""
+    _, cfgmgr32 = load_setupapi()
+    flags = CM_GETIDLIST_FILTER_CLASS | CM_GETIDLIST_FILTER_PRESENT
+    device_ids = []
+
+    for class_guid in CAMERA_CLASS_GUIDS:
+        size = wintypes.ULONG(0)
+        if cfgmgr32.CM_Get_Device_ID_List_SizeW(ctypes.byref(size), class_guid, flags) != CR_SUCCESS:
+            raise OSError("CM_Get_Device_ID_List_SizeW failed")
+
+        buffer = ctypes.create_unicode_buffer(size.value)
+        if cfgmgr32.CM_Get_Device_ID_ListW(class_guid, buffer, size.value, flags) != CR_SUCCESS:
+            raise OSError("CM_Get_Device_ID_ListW failed")
+
+        # Result is a double-NUL terminated multi-string
+        device_ids.extend(device_id for device_id in buffer[:size.value].split("\0") if device_id)
+
+    return device_ids
+
+
+def restart_device(device_id: str) -> bool:
+    """Restarts a device through its class installer so the new FriendlyName is picked up, False if a reboot is needed"""
+    try:
+        setupapi, _ = load_setupapi()
+    except OSError:
+        return False
+
+    dev_info = setupapi.SetupDiCreateDeviceInfoList(None, None)
+    if dev_info == INVALID_HANDLE_VALUE:
+        return False
+
+    try:
+        devinfo_data = SP_DEVINFO_DATA()
+        devinfo_data.cbSize = ctypes.sizeof(SP_DEVINFO_DATA)
+        if not setupapi.SetupDiOpenDeviceInfoW(dev_info, device_id, None, 0, ctypes.byref(devinfo_data)):
+            return False
+
+        # DICS_PROPCHANGE stops and starts the device, like disabling and enabling it
+        params = SP_PROPCHANGE_PARAMS()
+        params.ClassInstallHeader.cbSize = ctypes.sizeof(SP_CLASSINSTALL_HEADER)
+        params.ClassInstallHeader.InstallFunction = DIF_PROPERTYCHANGE
+        params.StateChange = DICS_PROPCHANGE
+        params.Scope = DICS_FLAG_GLOBAL
+        if not setupapi.SetupDiSetClassInstallParamsW(
+                dev_info, ctypes.byref(devinfo_data), ctypes.byref(params.ClassInstallHeader), ctypes.sizeof(params)
+        ):
+            return False
+        if not setupapi.SetupDiCallClassInstaller(DIF_PROPERTYCHANGE, dev_info, ctypes.byref(devinfo_data)):
+            return False
+
+        # The device could not be stopped, e.g. because it is in use, the change applies after a reboot
+        install_params = SP_DEVINSTALL_PARAMS_W()
+        install_params.cbSize = ctypes.sizeof(SP_DEVINSTALL_PARAMS_W)
+        if not setupapi.SetupDiGetDeviceInstallParamsW(dev_info, ctypes.byref(devinfo_data), ctypes.byref(install_params)):
+            return False
+        return not install_params.Flags & (DI_NEEDRESTART | DI_NEEDREBOOT)
+    finally:
+        setupapi.SetupDiDestroyDeviceInfoList(dev_info)
+
+
+def register_device_notification(hwnd: int):
+    """Registers a window for camera arrival/removal notifications, returns the handle or None"""
+    if sys.platform != "win32":
+        return None
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    user32.RegisterDeviceNotificationW.argtypes = [wintypes.HANDLE, ctypes.c_void_p, wintypes.DWORD]
+    user32.RegisterDeviceNotificationW.restype = wintypes.HANDLE
+
+    notification_filter = DEV_BROADCAST_DEVICEINTERFACE_W()
+    notification_filter.dbcc_size = ctypes.sizeof(DEV_BROADCAST_DEVICEINTERFACE_W)
+    notification_filter.dbcc_devicetype = DBT_DEVTYP_DEVICEINTERFACE
+    notification_filter.dbcc_classguid = GUID.from_string(KSCATEGORY_VIDEO_CAMERA)
+
+    return user32.RegisterDeviceNotificationW(hwnd, ctypes.byref(notification_filter), DEVICE_NOTIFY_WINDOW_HANDLE)
+
+
+def unregister_device_notification(handle):
+    """Releases a handle returned by register_device_notification"""
+    if handle and sys.platform == "win32":
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        user32.UnregisterDeviceNotification.argtypes = [wintypes.HANDLE]
+        user32.UnregisterDeviceNotification(handle)
+
+
+def get_boot_time() -> Optional[float]:
+    """Returns the system boot time in seconds since the epoch, None if unknown"""
+    if sys.platform != "win32":
+        return None
+    kernel32 = ctypes.WinDLL("kernel32")
+    kernel32.GetTickCount64.restype = ctypes.c_uint64
+    return time.time() - kernel32.GetTickCount64() / 1000
+
+
+def get_scan_cache_path() -> str:
+    """Returns the path of the on-disk scan cache"""
+    base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    return os.path.join(base, "CamRenamer", "cache.json")
+
+
+def get_splash_path(version: str, device_pixel_ratio: int) -> str:
+    """Returns the path of the splash rendered for an app version and device pixel ratio"""
+    base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    suffix = "@2x" if device_pixel_ratio > 1 else ""
+    return os.path.join(base, "CamRenamer", f"splash-{version}{suffix}.png")
+
+
+def _get_device_property(setupapi, dev_info, devinfo_data, prop: int) -> str:
+    """Reads a string device property (first entry for REG_MULTI_SZ values)"""
+    size = wintypes.DWORD(0)
+    buffer = ctypes.create_string_buffer(512)
+    while not setupapi.SetupDiGetDeviceRegistryPropertyW(
+            dev_info, ctypes.byref(devinfo_data), prop, None, buffer, len(buffer), ctypes.byref(size)
+    ):
+        if ctypes.get_last_error() != ERROR_INSUFFICIENT_BUFFER:
+            return ""
+        buffer = ctypes.create_string_buffer(size.value)
+    return ctypes.wstring_at(buffer)
+
+
+def _get_device_instance_id(setupapi, dev_info, devinfo_data) -> str:
+    """Reads the device instance ID (e.g. USB\\VID_046D&PID_0825\\...)"""
+    size = wintypes.DWORD(0)
+    buffer = ctypes.create_unicode_buffer(256)
+    while not setupapi.SetupDiGetDeviceInstanceIdW(
+            dev_info, ctypes.byref(devinfo_data), buffer, len(buffer), ctypes.byref(size)
+    ):
+        if ctypes.get_last_error() != ERROR_INSUFFICIENT_BUFFER:
+            return ""
+        buffer = ctypes.create_unicode_buffer(size.value)
+    return buffer.value
+
+
+def enumerate_cameras_setupapi(class_guids=CAMERA_CLASS_GUIDS,
+                               progress_callback: Optional[Callable[[int], None]] = None,
+                               is_cancelled: Optional[Callable[[], bool]] = None) -> List[CameraDevice]:
+    """Enumerates present devices of the given setup classes in-process via SetupAPI, stops early when cancelled"""
+    setupapi, cfgmgr32 = load_setupapi()
+
+    # Collect device info elements first so progress can be reported against a known total
+    device_lists = []
+    entries = []
+    try:
+        for class_guid in class_guids:
+            dev_info = setupapi.SetupDiGetClassDevsW(
+                ctypes.byref(GUID.from_string(class_guid)), None, None, DIGCF_PRESENT
+            )
+            if dev_info in (None, INVALID_HANDLE_VALUE):
+                continue
+            device_lists.append(dev_info)
+
+            index = 0
+            while True:
+                devinfo_data = SP_DEVINFO_DATA()
+                devinfo_data.cbSize = ctypes.sizeof(SP_DEVINFO_DATA)
+                if not setupapi.SetupDiEnumDeviceInfo(dev_info, index, ctypes.byref(devinfo_data)):
+                    # End of the list, anything else is a real enumeration failure
+                    error = ctypes.get_last_error()
+                    if error != ERROR_NO_MORE_ITEMS:
+                        raise ctypes.WinError(error)
+                    break
+                entries.append((dev_info, devinfo_data))
+                index += 1
+
+        cameras = []
+        total = len(entries)
+        for position, (dev_info, devinfo_data) in enumerate(entries, start=1):
+            if is_cancelled and is_cancelled():
+                break
+
+            instance_id = _get_device_instance_id(setupapi, dev_info, devinfo_data)
+            # Devices without a FriendlyName value are shown with their driver description
+            friendly_name = (
+                _get_device_property(setupapi, dev_info, devinfo_data, SPDRP_FRIENDLYNAME)
+                or _get_device_property(setupapi, dev_info, devinfo_data, SPDRP_DEVICEDESC)
+                or "Unknown"
+            )
+            # Interfaces of one composite device share the hardware ID, keep a single copy
+            hardware_id = sys.intern(_get_device_property(setupapi, dev_info, devinfo_data, SPDRP_HARDWAREID))
+
+            status = wintypes.ULONG(0)
+            problem = wintypes.ULONG(0)
+            result = cfgmgr32.CM_Get_DevNode_Status(ctypes.byref(status), ctypes.byref(problem), devinfo_data.DevInst, 0)
+            is_connected = result == CR_SUCCESS and not status.value & DN_HAS_PROBLEM
+
+            cameras.append(CameraDevice(
+                name=friendly_name,
+                device_id=instance_id,
+                registry_path=f"SYSTEM\\CurrentControlSet\\Enum\\{instance_id}",
+                friendly_name=friendly_name,
+                hardware_id=hardware_id,
+                is_connected=is_connected
+            ))
+
+            if progress_callback and (position % SCAN_PROGRESS_STEP == 0 or position == total):
+                progress_callback(int(position * 100 / total))
+
+        return cameras
+
+    finally:
+        for dev_info in device_lists:
+            setupapi.SetupDiDestroyDeviceInfoList(dev_info)
+
+
+@cache
+def _font(point_size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Arial in the given size, created once per size and weight"""
+    return QFont("Arial", point_size, weight)
+
+
+@cache
+def _emoji_font(point_size: int, weight: QFont.Weight = QFont.Weight.Normal) -> QFont:
+    """Arial with Segoe UI Emoji as explicit fallback for labels that start with an emoji"""
+    font = QFont("Arial", point_size, weight)
+    font.setFamilies(["Arial", "Segoe UI Emoji"])
+    return font
+
+
 class RegistrySearchDialog(QDialog):
     """Dialog to show registry search progress"""
 
@@ -51,7 +537,7 @@ class RegistrySearchDialog(QDialog):
         # Title
         title = QLabel("🔍 Searching Registry Entries...")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        title.setFont(_emoji_font(14, QFont.Weight.Bold))
         layout.addWidget(title)
 
         # Progress bar
@@ -117,6 +603,171 @@ class RegistrySearchDialog(QDialog):
         else:
             self.countdown_timer.stop()
 
+
+# Finds keys of a VID/PID below Enum\USB and the USB hub/composite driver Enum keys
+USB_INTERFACES_SEARCH_SCRIPT = r"""
+param([string]$vidPid)
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+$foundPaths = @()
+
+# Search USB-specific registry locations
+$usbPaths = @(
+    "HKLM:\SYSTEM\CurrentControlSet\Enum\USB",
+    "HKLM:\SYSTEM\CurrentControlSet\Services\usbhub\Enum",
+    "HKLM:\SYSTEM\CurrentControlSet\Services\usbccgp\Enum"
+)
+
+foreach ($usbPath in $usbPaths) {
+    if (Test-Path $usbPath) {
+        try {
+            Get-ChildItem $usbPath -Recurse -ErrorAction SilentlyContinue | 
+            Where-Object {$_.Name -like "*$vidPid*"} |
+            ForEach-Object {
+                $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\", ""
+                $foundPaths += $relativePath
+            }
+        } catch {
+            # Continue on errors
+        }
+    }
+}
+
+$foundPaths | Where-Object {$_ -ne ""} | ForEach-Object { Write-Output $_ }
+"""
+
+
+# Finds the Enum keys of camera related driver services that list a VID/PID
+SYSTEM_DRIVERS_SEARCH_SCRIPT = r"""
+param([string]$vidPid)
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+$foundPaths = @()
+
+# Search in Services for driver entries
+$servicesPath = "HKLM:\SYSTEM\CurrentControlSet\Services"
+
+# Common camera/video driver services
+$driverServices = @(
+    "usbvideo", "ksthunk", "stream", "swenum", "usbaudio", 
+    "usbccgp", "usbhub", "winusb", "wudfrd", "WUDFRd"
+)
+
+foreach ($service in $driverServices) {
+    $servicePath = Join-Path $servicesPath $service
+    if (Test-Path $servicePath) {
+        try {
+            $enumPath = Join-Path $servicePath "Enum"
+            if (Test-Path $enumPath) {
+                $enumProps = Get-ItemProperty $enumPath -ErrorAction SilentlyContinue
+                $enumProps.PSObject.Properties | Where-Object {
+                    $_.Value -like "*$vidPid*"
+                } | ForEach-Object {
+                    $relativePath = "SYSTEM\CurrentControlSet\Services\$service\Enum"
+                    $foundPaths += $relativePath
+                }
+            }
+        } catch {
+            # Continue
+        }
+    }
+}
+
+$foundPaths | Where-Object {$_ -ne ""} | ForEach-Object { Write-Output $_ }
+"""
+
+
+# Finds driver keys below Control\Class whose MatchingDeviceId or HardwareID contains a VID/PID
+CONTROL_ENTRIES_SEARCH_SCRIPT = r"""
+param([string]$vidPid)
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+$foundPaths = @()
+
+# Search in Class registry for device classes
+$classPath = "HKLM:\SYSTEM\CurrentControlSet\Control\Class"
+
+if (Test-Path $classPath) {
+    try {
+        Get-ChildItem $classPath -ErrorAction SilentlyContinue | ForEach-Object {
+            $classGuidPath = $_.PSPath
+            try {
+                Get-ChildItem $classGuidPath -ErrorAction SilentlyContinue | ForEach-Object {
+                    $subKeyPath = $_.PSPath
+                    try {
+                        $props = Get-ItemProperty $subKeyPath -ErrorAction SilentlyContinue
+                        if ($props.MatchingDeviceId -like "*$vidPid*" -or 
+                            $props.HardwareID -like "*$vidPid*") {
+                            $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\", ""
+                            $foundPaths += $relativePath
+                        }
+                    } catch {
+                        # Continue
+                    }
+                }
+            } catch {
+                # Continue
+            }
+        }
+    } catch {
+        # Continue
+    }
+}
+
+$foundPaths | Where-Object {$_ -ne ""} | ForEach-Object { Write-Output $_ }
+"""
+
+
+# Searches the registry for keys of a VID/PID, device ID or camera name
+COMPREHENSIVE_SEARCH_SCRIPT = r"""
+param([string]$vidPid, [string]$deviceId, [string]$nameWord)
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+$foundPaths = @()
+
+# Search for any registry keys containing our VID/PID
+$searchRoots = @(
+    "HKLM:\SYSTEM\CurrentControlSet",
+    "HKLM:\SOFTWARE\Microsoft\Windows NT\CurrentVersion",
+    "HKLM:\SOFTWARE\Classes"
+)
+
+foreach ($root in $searchRoots) {
+    if (Test-Path $root) {
+        try {
+            # Use Get-ChildItem with specific depth to avoid infinite recursion
+            Get-ChildItem $root -Recurse -Depth 3 -ErrorAction SilentlyContinue |
+            Where-Object {$_.Name -like "*$vidPid*" -or $_.Name -like "*$deviceId*"} |
+            ForEach-Object {
+                $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\", ""
+                $foundPaths += $relativePath
+            }
+        } catch {
+            # Continue on access errors
+        }
+    }
+}
+
+# Also search for FriendlyName entries that might reference our device
+try {
+    Get-ChildItem "HKLM:\SYSTEM\CurrentControlSet\Enum" -Recurse -ErrorAction SilentlyContinue |
+    Where-Object {
+        try {
+            $props = Get-ItemProperty $_.PSPath -ErrorAction SilentlyContinue
+            $props.FriendlyName -like "*$nameWord*" -or
+            $props.DeviceDesc -like "*$nameWord*"
+        } catch {
+            $false
+        }
+    } |
+    ForEach-Object {
+        $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\", ""
+        $foundPaths += $relativePath
+    }
+} catch {
+    # Continue
+}
+
+$foundPaths | Where-Object {$_ -ne ""} | Select-Object -Unique | ForEach-Object { Write-Output $_ }
+"""
+
+
 class EnhancedRegistrySearchThread(QThread):
     """Enhanced thread for comprehensive registry search"""
     search_completed = Signal(list)
@@ -331,59 +982,11 @@ class EnhancedRegistrySearchThread(QThread):
         if not device_id:
             return []
 
-        powershell_cmd = f"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $vidPid = "{device_id}"
-        $foundPaths = @()
-
-        # Comprehensive Device Classes search
-        $deviceClassesPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\DeviceClasses"
-
-        # Extended list of relevant GUIDs for cameras and multimedia devices
-        $relevantGUIDs = @(
-            "{{65e8773d-8f56-11d0-a3b9-00a0c9223196}}",  # Image devices
-            "{{e5323777-f976-4f5b-9b55-b94699c46e44}}",  # Camera devices
-            "{{6994AD05-93EF-11D0-A3CC-00A0C9223196}}",  # Image class
-            "{{4D36E96C-E325-11CE-BFC1-08002BE10318}}",  # Sound/Video devices
-            "{{6bdd1fc6-810f-11d0-bec7-08002be2092f}}",  # USB devices
-            "{{4d36e972-e325-11ce-bfc1-08002be10318}}",  # Multimedia devices
-            "{{c06ff265-ae09-48f0-812c-16753d7cba83}}",  # WDM streaming devices
-            "{{6994ad04-93ef-11d0-a3cc-00a0c9223196}}"   # Still image devices
-        )
-
-        foreach ($guid in $relevantGUIDs) {{
-            $guidPath = Join-Path $deviceClassesPath $guid
-            if (Test-Path $guidPath) {{
-                try {{
-                    $subKeys = Get-ChildItem $guidPath -ErrorAction SilentlyContinue
-                    foreach ($subKey in $subKeys) {{
-                        if ($subKey.Name -like "*$vidPid*") {{
-                            $relativePath = $subKey.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-
-                            # Check specifically for #GLOBAL\Device Parameters path with FriendlyName
-                            $friendlyNamePath = Join-Path $subKey.PSPath "#GLOBAL\\Device Parameters"
-                            if (Test-Path $friendlyNamePath) {{
-                                try {{
-                                    $friendlyNameValue = Get-ItemProperty -Path $friendlyNamePath -Name "FriendlyName" -ErrorAction SilentlyContinue
-                                    if ($friendlyNameValue -and $friendlyNameValue.FriendlyName) {{
-                                        $foundPaths += "$relativePath\\#GLOBAL\\Device Parameters"
-                                    }}
-                                }} catch {{
-                                    # Continue if FriendlyName property doesn't exist
-                                }}
-                            }}
-                        }}
-                    }}
-                }} catch {{
-                    # Continue on access errors
-                }}
-            }}
-        }}
-
-        $foundPaths | Where-Object {{$_ -ne ""}} | ForEach-Object {{ Write-Output $_ }}
-        """
-
-        paths = self.execute_powershell(powershell_cmd)
+        paths = []
+        for key_path in find_device_class_keys(winreg.HKEY_LOCAL_MACHINE, device_id):
+            parameters_path = f"{key_path}\\#GLOBAL\\Device Parameters"
+            if _read_string_value(winreg.HKEY_LOCAL_MACHINE, parameters_path, "FriendlyName"):
+                paths.append(parameters_path)
         self.result_found.emit(f"🎯 Found {len(paths)} registry paths with FriendlyName")
         return paths
 
@@ -411,56 +1014,12 @@ class EnhancedRegistrySearchThread(QThread):
         if not vid_pid:
             return []
 
-        powershell_cmd = f"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $vidPid = "{vid_pid}"
-        $foundPaths = @()
-
-        # Comprehensive Device Classes search
-        $deviceClassesPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\DeviceClasses"
-
-        # Extended list of relevant GUIDs for cameras and multimedia devices
-        $relevantGUIDs = @(
-            "{{65e8773d-8f56-11d0-a3b9-00a0c9223196}}",  # Image devices
-            "{{e5323777-f976-4f5b-9b55-b94699c46e44}}",  # Camera devices
-            "{{6994AD05-93EF-11D0-A3CC-00A0C9223196}}",  # Image class
-            "{{4D36E96C-E325-11CE-BFC1-08002BE10318}}",  # Sound/Video devices
-            "{{6bdd1fc6-810f-11d0-bec7-08002be2092f}}",  # USB devices
-            "{{4d36e972-e325-11ce-bfc1-08002be10318}}",  # Multimedia devices
-            "{{c06ff265-ae09-48f0-812c-16753d7cba83}}",  # WDM streaming devices
-            "{{6994ad04-93ef-11d0-a3cc-00a0c9223196}}"   # Still image devices
-        )
-
-        foreach ($guid in $relevantGUIDs) {{
-            $guidPath = Join-Path $deviceClassesPath $guid
-            if (Test-Path $guidPath) {{
-                try {{
-                    $subKeys = Get-ChildItem $guidPath -ErrorAction SilentlyContinue
-                    foreach ($subKey in $subKeys) {{
-                        if ($subKey.Name -like "*$vidPid*") {{
-                            $relativePath = $subKey.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-                            $foundPaths += $relativePath
-
-                            # Check for nested paths
-                            $nestedPaths = @("#GLOBAL", "Control", "Device Parameters")
-                            foreach ($nested in $nestedPaths) {{
-                                $nestedPath = Join-Path $subKey.PSPath $nested
-                                if (Test-Path $nestedPath) {{
-                                    $foundPaths += "$relativePath\\$nested"
-                                }}
-                            }}
-                        }}
-                    }}
-                }} catch {{
-                    # Continue on access errors
-                }}
-            }}
-        }}
-
-        $foundPaths | Where-Object {{$_ -ne ""}} | ForEach-Object {{ Write-Output $_ }}
-        """
-
-        paths = self.execute_powershell(powershell_cmd)
+        paths = []
+        for key_path in find_device_class_keys(winreg.HKEY_LOCAL_MACHINE, vid_pid):
+            paths.append(key_path)
+            for nested in ("#GLOBAL", "Control", "Device Parameters"):
+                if _key_exists(winreg.HKEY_LOCAL_MACHINE, f"{key_path}\\{nested}"):
+                    paths.append(f"{key_path}\\{nested}")
         self.result_found.emit(f"🎯 Found {len(paths)} Device Classes entries")
         return paths
 
@@ -469,37 +1028,7 @@ class EnhancedRegistrySearchThread(QThread):
         if not vid_pid:
             return []
 
-        powershell_cmd = f"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $vidPid = "{vid_pid}"
-        $foundPaths = @()
-        
-        # Search USB-specific registry locations
-        $usbPaths = @(
-            "HKLM:\\SYSTEM\\CurrentControlSet\\Enum\\USB",
-            "HKLM:\\SYSTEM\\CurrentControlSet\\Services\\usbhub\\Enum",
-            "HKLM:\\SYSTEM\\CurrentControlSet\\Services\\usbccgp\\Enum"
-        )
-        
-        foreach ($usbPath in $usbPaths) {{
-            if (Test-Path $usbPath) {{
-                try {{
-                    Get-ChildItem $usbPath -Recurse -ErrorAction SilentlyContinue | 
-                    Where-Object {{$_.Name -like "*$vidPid*"}} |
-                    ForEach-Object {{
-                        $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-                        $foundPaths += $relativePath
-                    }}
-                }} catch {{
-                    # Continue on errors
-                }}
-            }}
-        }}
-        
-        $foundPaths | Where-Object {{$_ -ne ""}} | ForEach-Object {{ Write-Output $_ }}
-        """
-
-        paths = self.execute_powershell(powershell_cmd)
+        paths = self.execute_powershell(USB_INTERFACES_SEARCH_SCRIPT, vid_pid)
         self.result_found.emit(f"🔌 Found {len(paths)} USB interface entries")
         return paths
 
@@ -508,44 +1037,7 @@ class EnhancedRegistrySearchThread(QThread):
         if not vid_pid:
             return []
 
-        powershell_cmd = f"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $vidPid = "{vid_pid}"
-        $foundPaths = @()
-        
-        # Search in Services for driver entries
-        $servicesPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Services"
-        
-        # Common camera/video driver services
-        $driverServices = @(
-            "usbvideo", "ksthunk", "stream", "swenum", "usbaudio", 
-            "usbccgp", "usbhub", "winusb", "wudfrd", "WUDFRd"
-        )
-        
-        foreach ($service in $driverServices) {{
-            $servicePath = Join-Path $servicesPath $service
-            if (Test-Path $servicePath) {{
-                try {{
-                    $enumPath = Join-Path $servicePath "Enum"
-                    if (Test-Path $enumPath) {{
-                        $enumProps = Get-ItemProperty $enumPath -ErrorAction SilentlyContinue
-                        $enumProps.PSObject.Properties | Where-Object {{
-                            $_.Value -like "*$vidPid*"
-                        }} | ForEach-Object {{
-                            $relativePath = "SYSTEM\\CurrentControlSet\\Services\\$service\\Enum"
-                            $foundPaths += $relativePath
-                        }}
-                    }}
-                }} catch {{
-                    # Continue
-                }}
-            }}
-        }}
-        
-        $foundPaths | Where-Object {{$_ -ne ""}} | ForEach-Object {{ Write-Output $_ }}
-        """
-
-        paths = self.execute_powershell(powershell_cmd)
+        paths = self.execute_powershell(SYSTEM_DRIVERS_SEARCH_SCRIPT, vid_pid)
         self.result_found.emit(f"⚙️ Found {len(paths)} system driver entries")
         return paths
 
@@ -554,45 +1046,7 @@ class EnhancedRegistrySearchThread(QThread):
         if not vid_pid:
             return []
 
-        powershell_cmd = f"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $vidPid = "{vid_pid}"
-        $foundPaths = @()
-        
-        # Search in Class registry for device classes
-        $classPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class"
-        
-        if (Test-Path $classPath) {{
-            try {{
-                Get-ChildItem $classPath -ErrorAction SilentlyContinue | ForEach-Object {{
-                    $classGuidPath = $_.PSPath
-                    try {{
-                        Get-ChildItem $classGuidPath -ErrorAction SilentlyContinue | ForEach-Object {{
-                            $subKeyPath = $_.PSPath
-                            try {{
-                                $props = Get-ItemProperty $subKeyPath -ErrorAction SilentlyContinue
-                                if ($props.MatchingDeviceId -like "*$vidPid*" -or 
-                                    $props.HardwareID -like "*$vidPid*") {{
-                                    $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-                                    $foundPaths += $relativePath
-                                }}
-                            }} catch {{
-                                # Continue
-                            }}
-                        }}
-                    }} catch {{
-                        # Continue
-                    }}
-                }}
-            }} catch {{
-                # Continue
-            }}
-        }}
-        
-        $foundPaths | Where-Object {{$_ -ne ""}} | ForEach-Object {{ Write-Output $_ }}
-        """
-
-        paths = self.execute_powershell(powershell_cmd)
+        paths = self.execute_powershell(CONTROL_ENTRIES_SEARCH_SCRIPT, vid_pid)
         self.result_found.emit(f"🎛️ Found {len(paths)} control panel entries")
         return paths
 
@@ -601,330 +1055,537 @@ class EnhancedRegistrySearchThread(QThread):
         if not vid_pid:
             return []
 
-        powershell_cmd = f"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $vidPid = "{vid_pid}"
-        $deviceId = "{self.camera.device_id}"
-        $foundPaths = @()
-        
-        # Search for any registry keys containing our VID/PID
-        $searchRoots = @(
-            "HKLM:\\SYSTEM\\CurrentControlSet",
-            "HKLM:\\SOFTWARE\\Microsoft\\Windows NT\\CurrentVersion",
-            "HKLM:\\SOFTWARE\\Classes"
-        )
-        
-        foreach ($root in $searchRoots) {{
-            if (Test-Path $root) {{
-                try {{
-                    # Use Get-ChildItem with specific depth to avoid infinite recursion
-                    Get-ChildItem $root -Recurse -Depth 3 -ErrorAction SilentlyContinue |
-                    Where-Object {{$_.Name -like "*$vidPid*" -or $_.Name -like "*$deviceId*"}} |
-                    ForEach-Object {{
-                        $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-                        $foundPaths += $relativePath
-                    }}
-                }} catch {{
-                    # Continue on access errors
-                }}
-            }}
-        }}
-        
-        # Also search for FriendlyName entries that might reference our device
-        try {{
-            Get-ChildItem "HKLM:\\SYSTEM\\CurrentControlSet\\Enum" -Recurse -ErrorAction SilentlyContinue |
-            Where-Object {{
-                try {{
-                    $props = Get-ItemProperty $_.PSPath -ErrorAction SilentlyContinue
-                    $props.FriendlyName -like "*{self.camera.friendly_name.split()[0]}*" -or
-                    $props.DeviceDesc -like "*{self.camera.friendly_name.split()[0]}*"
-                }} catch {{
-                    $false
-                }}
-            }} |
-            ForEach-Object {{
-                $relativePath = $_.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-                $foundPaths += $relativePath
-            }}
-        }} catch {{
-            # Continue
-        }}
-        
-        $foundPaths | Where-Object {{$_ -ne ""}} | Select-Object -Unique | ForEach-Object {{ Write-Output $_ }}
-        """
-
-        paths = self.execute_powershell(powershell_cmd)
+        # The first word of the camera name is also searched in FriendlyName and DeviceDesc
+        name_word = self.camera.friendly_name.split()[0]
+        paths = self.execute_powershell(COMPREHENSIVE_SEARCH_SCRIPT, vid_pid, self.camera.device_id, name_word)
         self.result_found.emit(f"🔍 Found {len(paths)} comprehensive search results")
         return paths
 
-    def execute_powershell(self, cmd: str) -> List[str]:
-        """Execute PowerShell command and return results"""
+    def execute_powershell(self, cmd: str, *args: str) -> List[str]:
+        """Execute PowerShell command with the given arguments in the persistent host and return results"""
+        import subprocess
         try:
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", cmd],
-                startupinfo=startupinfo,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=30
-            )
-
-            if result.returncode == 0 and result.stdout.strip():
-                paths = []
-                for line in result.stdout.strip().split('\n'):
-                    path = line.strip()
-                    if path:
-                        paths.append(path)
-                return paths
+            output = powershell_host.run(cmd, *args, timeout=30)
+            return [line.strip() for line in output.splitlines() if line.strip()]
+        except subprocess.TimeoutExpired:
+            self.result_found.emit("⚠️ PowerShell execution timed out")
         except Exception as e:
             self.result_found.emit(f"⚠️ PowerShell execution error: {str(e)}")
 
         return []
 
 
-# Update the original RegistrySearchThread class to use the enhanced version
-class RegistrySearchThread(EnhancedRegistrySearchThread):
-    """Updated registry search thread - inherits from enhanced version"""
-    pass
+# Script run by the persistent PowerShell host: reads one base64-encoded JSON request
+# ({"script": ..., "args": [...]}) per line from stdin, runs the script with the
+# arguments bound to its param() block and answers with one JSON line prefixed with
+# the marker. Script blocks are parsed once and reused for later requests.
+POWERSHELL_HOST_MARKER = "#CAMRENAMER#"
+POWERSHELL_HOST_SHUTDOWN = "SHUTDOWN"
+POWERSHELL_HOST_SCRIPT = r"""
+[Console]::OutputEncoding = [System.Text.Encoding]::UTF8
+$scripts = New-Object 'System.Collections.Generic.Dictionary[string,scriptblock]'
+while ($true) {
+    $line = [Console]::In.ReadLine()
+    if ($line -eq $null -or $line -eq 'SHUTDOWN') { break }
+    try {
+        $request = [System.Text.Encoding]::UTF8.GetString([Convert]::FromBase64String($line)) | ConvertFrom-Json
+        if (-not $scripts.ContainsKey($request.script)) {
+            $scripts[$request.script] = [ScriptBlock]::Create($request.script)
+        }
+        $arguments = @($request.args)
+        $output = & $scripts[$request.script] @arguments | Out-String
+        $response = @{ ok = $true; output = $output }
+    } catch {
+        $response = @{ ok = $false; error = $_.Exception.Message }
+    }
+    [Console]::Out.WriteLine('#CAMRENAMER#' + ($response | ConvertTo-Json -Compress))
+    [Console]::Out.Flush()
+}
+"""
+
+# Exports the HKLM keys passed as arguments in .reg file syntax
+BACKUP_REGISTRY_SCRIPT = r"""
+foreach ($regPath in $args) {
+    $fullPath = "HKLM:\$regPath"
+    if (Test-Path $fullPath) {
+        try {
+            $key = Get-Item $fullPath -ErrorAction SilentlyContinue
+            if ($key) {
+                Write-Output "[HKEY_LOCAL_MACHINE\$regPath]"
+
+                $key.GetValueNames() | ForEach-Object {
+                    $valueName = $_
+                    $value = $key.GetValue($valueName)
+                    $valueType = $key.GetValueKind($valueName)
+
+                    if ($valueName -eq "") {
+                        $regValueName = "@"
+                    } else {
+                        $regValueName = "`"$valueName`""
+                    }
+
+                    switch ($valueType) {
+                        "String" {
+                            $escapedValue = $value -replace '\\', '\\\\' -replace '"', '\"'
+                            Write-Output "$regValueName=`"$escapedValue`""
+                        }
+                        "DWord" {
+                            $hexValue = [System.Convert]::ToString([int]$value, 16).PadLeft(8, '0')
+                            Write-Output "$regValueName=dword:$hexValue"
+                        }
+                        "QWord" {
+                            $hexValue = [System.Convert]::ToString([long]$value, 16).PadLeft(16, '0')
+                            Write-Output "$regValueName=qword:$hexValue"
+                        }
+                        "Binary" {
+                            $hexString = ($value | ForEach-Object { [System.Convert]::ToString($_, 16).PadLeft(2, '0') }) -join ','
+                            Write-Output "$regValueName=hex:$hexString"
+                        }
+                        "MultiString" {
+                            $hexBytes = [System.Text.Encoding]::Unicode.GetBytes(($value -join "`0") + "`0`0")
+                            $hexString = ($hexBytes | ForEach-Object { [System.Convert]::ToString($_, 16).PadLeft(2, '0') }) -join ','
+                            Write-Output "$regValueName=hex(7):$hexString"
+                        }
+                        "ExpandString" {
+                            $hexBytes = [System.Text.Encoding]::Unicode.GetBytes($value + "`0")
+                            $hexString = ($hexBytes | ForEach-Object { [System.Convert]::ToString($_, 16).PadLeft(2, '0') }) -join ','
+                            Write-Output "$regValueName=hex(2):$hexString"
+                        }
+                    }
+                }
+                Write-Output ""
+            }
+        } catch {
+            Write-Output "; Error accessing: $regPath"
+            Write-Output ""
+        }
+    } else {
+        Write-Output "; Registry key not found: $regPath"
+        Write-Output ""
+    }
+}
+"""
 
 
-class RegistrySearchThread(QThread):
-    """Thread for searching registry entries without blocking UI"""
-    search_completed = Signal(list)
-    progress_updated = Signal(str)
+class PowerShellHost:
+    """Long-lived PowerShell process that executes commands sent over its stdin"""
 
-    def __init__(self, camera: CameraDevice):
-        super().__init__()
-        self.camera = camera
+    def __init__(self):
+        self._process = None
+        self._responses = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self):
+        """Starts the PowerShell process on first use or after it exited"""
+        import queue
+        import subprocess
+        if self._process is not None and self._process.poll() is None:
+            return
 
-    def run(self):
-        """Search for registry paths in background thread"""
+        self._process = subprocess.Popen(
+            powershell_args(POWERSHELL_HOST_SCRIPT),
+            startupinfo=get_startupinfo(),
+            creationflags=get_creationflags(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._process.stdout, self._responses),
+            daemon=True
+        ).start()
+
+    @staticmethod
+    def _read_responses(stdout, responses: "queue.Queue"):
+        """Forwards marked response lines from the host to the response queue"""
+        marker = POWERSHELL_HOST_MARKER.encode('ascii')
+        for line in stdout:
+            if line.startswith(marker):
+                responses.put(line[len(marker):])
+        responses.put(None)
+
+    def _kill(self):
+        """Kills the host process, it is restarted on the next call"""
+        if self._process is not None:
+            self._process.kill()
+            self._process = None
+
+    def run(self, script: str, *args: str, timeout: float = 30) -> str:
+        """Executes a PowerShell script with the given arguments in the host and returns its output"""
+        import queue
+        import subprocess
+        with self._lock:
+            self._ensure_started()
+            request = json.dumps({"script": script, "args": list(args)})
+            payload = base64.b64encode(request.encode('utf-8'))
+            try:
+                self._process.stdin.write(payload + b"\n")
+                self._process.stdin.flush()
+                line = self._responses.get(timeout=timeout)
+            except queue.Empty:
+                self._kill()
+                raise subprocess.TimeoutExpired(script, timeout) from None
+            except OSError as e:
+                self._kill()
+                raise RuntimeError(f"PowerShell host not available: {e}") from e
+
+            if line is None:
+                self._kill()
+                raise RuntimeError("PowerShell host exited unexpectedly")
+
+            response = json.loads(line)
+            if not response.get("ok"):
+                raise RuntimeError(response.get("error") or "Unknown PowerShell error")
+            return response.get("output") or ""
+
+    def cancel(self):
+        """Kills the host process, a running command fails immediately"""
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def shutdown(self):
+        """Asks the host to exit and kills it if it does not respond"""
+        import subprocess
+        if not self._lock.acquire(timeout=1):
+            self._kill()
+            return
         try:
-            self.progress_updated.emit("Searching registry entries...")
-            registry_paths = self.find_registry_paths_optimized()
-            self.search_completed.emit(registry_paths)
-        except Exception as e:
-            print(f"Error in registry search thread: {e}")
-            self.search_completed.emit([])
+            if self._process is None or self._process.poll() is not None:
+                return
+            try:
+                self._process.stdin.write(POWERSHELL_HOST_SHUTDOWN.encode('ascii') + b"\n")
+                self._process.stdin.flush()
+                self._process.wait(timeout=2)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+            self._kill()
+        finally:
+            self._lock.release()
+
+
+powershell_host = PowerShellHost()
+
+
+def _try_open_and_set(root, registry_path: str, new_name: str) -> bool:
+    """Sets FriendlyName on a registry key below root, returns False if the key cannot be written"""
+    try:
+        with winreg.OpenKey(
+                root,
+                registry_path,
+                0,
+                winreg.KEY_SET_VALUE | REGISTRY_VIEW_FLAG
+        ) as key:
+            winreg.SetValueEx(key, "FriendlyName", 0, winreg.REG_SZ, new_name)
+        return True
+    except OSError:
+        return False
+
+
+def _enum_subkeys(root, registry_path: str) -> List[str]:
+    """Names of the subkeys of a registry key, empty if it cannot be opened"""
+    names = []
+    try:
+        with winreg.OpenKey(root, registry_path, 0, winreg.KEY_READ | REGISTRY_VIEW_FLAG) as key:
+            while True:
+                try:
+                    names.append(winreg.EnumKey(key, len(names)))
+                except OSError:
+                    break
+    except OSError:
+        pass
+    return names
+
+
+def _key_exists(root, registry_path: str) -> bool:
+    """True if the registry key exists and can be opened for reading"""
+    try:
+        with winreg.OpenKey(root, registry_path, 0, winreg.KEY_READ | REGISTRY_VIEW_FLAG):
+            return True
+    except OSError:
+        return False
+
+
+def _read_string_value(root, registry_path: str, name: str) -> str:
+    """Reads a string registry value, empty if the key or value is missing"""
+    try:
+        with winreg.OpenKey(root, registry_path, 0, winreg.KEY_QUERY_VALUE | REGISTRY_VIEW_FLAG) as key:
+            value, _ = winreg.QueryValueEx(key, name)
+    except OSError:
+        return ""
+    return value if isinstance(value, str) else ""
+
+
+def find_device_class_keys(root, pattern: str) -> List[str]:
+    """Interface keys below the searched DeviceClasses GUIDs whose name contains pattern"""
+    needle = pattern.lower()
+    paths = []
+    for class_guid in DEVICE_CLASSES_SEARCH_GUIDS:
+        class_path = f"{DEVICE_CLASSES_PATH}\\{class_guid}"
+        paths.extend(f"{class_path}\\{name}" for name in _enum_subkeys(root, class_path) if needle in name.lower())
+    return paths
+
+
+def find_device_class_paths(root, device_id: str) -> List[str]:
+    """Device Parameters paths of the camera interfaces registered for a device below DeviceClasses"""
+    # Interface key names contain the instance ID with backslashes replaced by '#'
+    needle = device_id.replace("\\", "#").lower()
+    paths = []
+    for class_guid in CAMERA_INTERFACE_CLASS_GUIDS:
+        class_path = f"{DEVICE_CLASSES_PATH}\\{class_guid}"
+        for name in _enum_subkeys(root, class_path):
+            if needle in name.lower():
+                paths.append(f"{class_path}\\{name}\\#GLOBAL\\Device Parameters")
+    return paths
+
+
+def enumerate_cameras_powershell(status_callback: Callable[[str], None]) -> Optional[List[CameraDevice]]:
+    """Fallback camera detection via PowerShell Get-PnpDevice, returns None on error"""
+    cameras = []
+
+    # PowerShell command for camera detection, filtered by setup class. One tab-separated
+    # line per device (name, instance ID, first hardware ID, status) instead of JSON.
+    powershell_cmd = """
+    Get-PnpDevice -Class Camera,Image -PresentOnly -ErrorAction SilentlyContinue | ForEach-Object {
+        $fields = $_.FriendlyName, $_.InstanceId, @($_.HardwareID)[0], $_.Status
+        ($fields | ForEach-Object { "$_" -replace "[`t`r`n]", " " }) -join "`t"
+    }
+    """
+
+    # Execute in the persistent PowerShell host
+    try:
+        output = powershell_host.run(powershell_cmd, timeout=5)
+    except RuntimeError as e:
+        status_callback(f"PowerShell error: {e}")
+        return None
+
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if len(fields) != 4:
+            continue
+        friendly_name, instance_id, hardware_id, status = fields
+
+        # Construct registry path
+        registry_path = f"SYSTEM\\CurrentControlSet\\Enum\\{instance_id}"
+
+        camera = CameraDevice(
+            name=friendly_name or 'Unknown',
+            device_id=instance_id,
+            registry_path=registry_path,
+            friendly_name=friendly_name or 'Unknown',
+            hardware_id=sys.intern(hardware_id),
+            is_connected=(status == _OK)
+        )
+        cameras.append(camera)
 
-    def find_registry_paths_optimized(self) -> List[str]:
-        """Optimized registry search with faster PowerShell queries"""
-        registry_paths = []
+    return cameras
 
-        # Standard device path
-        device_path = f"SYSTEM\\CurrentControlSet\\Enum\\{self.camera.device_id}"
-        registry_paths.append(device_path)
-
-        # Optimized PowerShell search with limited scope
-        powershell_cmd = r"""
-        [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-        $deviceID = "{}"
-        $hardwareID = "{}"
-        
-        # Extract VID and PID for targeted search
-        $vidPid = ""
-        if ($hardwareID -match "VID_([0-9A-F]{{4}})&PID_([0-9A-F]{{4}})") {{
-            $vidPid = "VID_$($matches[1])&PID_$($matches[2])"
-        }}
-        
-        $foundPaths = @()
-        
-        # TARGETED DeviceClasses search - much faster
-        if ($vidPid -ne "") {{
-            $deviceClassesPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\DeviceClasses"
-            
-            # Only search in common camera GUIDs to speed up
-            $cameraGUIDs = @(
-                "{{65e8773d-8f56-11d0-a3b9-00a0c9223196}}",
-                "{{e5323777-f976-4f5b-9b55-b94699c46e44}}",
-                "{{6994AD05-93EF-11D0-A3CC-00A0C9223196}}",
-                "{{4D36E96C-E325-11CE-BFC1-08002BE10318}}"
-            )
-            
-            foreach ($guid in $cameraGUIDs) {{
-                $guidPath = Join-Path $deviceClassesPath $guid
-                if (Test-Path $guidPath) {{
-                    try {{
-                        # Use Get-ChildItem with Name filter for speed
-                        $matchingKeys = Get-ChildItem $guidPath -Name "*$vidPid*" -ErrorAction SilentlyContinue
-                        
-                        foreach ($keyName in $matchingKeys) {{
-                            $fullKeyPath = "SYSTEM\\CurrentControlSet\\Control\\DeviceClasses\\$guid\\$keyName"
-                            $foundPaths += $fullKeyPath
-                            
-                            # Check for #GLOBAL\Device Parameters
-                            $globalDeviceParamsPath = "$guidPath\\$keyName\\#GLOBAL\\Device Parameters"
-                            if (Test-Path $globalDeviceParamsPath) {{
-                                $foundPaths += "$fullKeyPath\\#GLOBAL\\Device Parameters"
-                            }}
-                            
-                            # Check for direct Device Parameters  
-                            $directDeviceParamsPath = "$guidPath\\$keyName\\Device Parameters"
-                            if (Test-Path $directDeviceParamsPath) {{
-                                $foundPaths += "$fullKeyPath\\Device Parameters"
-                            }}
-                        }}
-                    }} catch {{
-                        # Continue on access errors
-                    }}
-                }}
-            }}
-        }}
-        
-        # Quick search in Class registry for device-specific entries
-        $classPath = "HKLM:\\SYSTEM\\CurrentControlSet\\Control\\Class"
-        if (Test-Path $classPath) {{
-            try {{
-                # Only search in Image and Media class GUIDs
-                $relevantClasses = @(
-                    "{{6bdd1fc6-810f-11d0-bec7-08002be2092f}}",  # USB
-                    "{{4d36e96c-e325-11ce-bfc1-08002be10318}}",  # Sound/Video
-                    "{{6994ad05-93ef-11d0-a3cc-00a0c9223196}}"   # Image
-                )
-                
-                foreach ($classGuid in $relevantClasses) {{
-                    $classGuidPath = Join-Path $classPath $classGuid
-                    if (Test-Path $classGuidPath) {{
-                        try {{
-                            $classSubKeys = Get-ChildItem $classGuidPath -ErrorAction SilentlyContinue
-                            foreach ($subKey in $classSubKeys) {{
-                                $subKeyPath = $subKey.PSPath
-                                try {{
-                                    $matchingDevicesProp = Get-ItemProperty $subKeyPath -Name "MatchingDeviceId" -ErrorAction SilentlyContinue
-                                    if ($matchingDevicesProp -and $matchingDevicesProp.MatchingDeviceId -like "*$vidPid*") {{
-                                        $relativePath = $subKey.Name -replace "HKEY_LOCAL_MACHINE\\\\", ""
-                                        $foundPaths += $relativePath
-                                    }}
-                                }} catch {{
-                                    # Continue
-                                }}
-                            }}
-                        }} catch {{
-                            # Continue
-                        }}
-                    }}
-                }}
-            }} catch {{
-                # Continue
-            }}
-        }}
-        
-        # Output unique paths
-        $foundPaths | Select-Object -Unique | ForEach-Object {{ Write-Output $_ }}
-        """.format(self.camera.device_id, self.camera.hardware_id)
 
-        try:
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", powershell_cmd],
-                startupinfo=startupinfo,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=15  # Reduced timeout
-            )
+class ScanSignals(QObject):
+    """Signals emitted by camera scan workers running on the thread pool"""
+    progress_updated = Signal(str, int)
+    status_updated = Signal(str)
+    completed = Signal(str, object)
+
+
+class CameraScanWorker(QRunnable):
+    """Enumerates the cameras of a single device class on the global thread pool"""
 
-            if result.returncode == 0 and result.stdout.strip():
-                for line in result.stdout.strip().split('\n'):
-                    path = line.strip()
-                    if path and path not in registry_paths:
-                        registry_paths.append(path)
+    def __init__(self, key: str, signals: ScanSignals, semaphore: QSemaphore, cancelled: threading.Event):
+        super().__init__()
+        self.key = key
+        self.signals = signals
+        self.semaphore = semaphore
+        self.cancelled = cancelled
 
+    def run(self):
+        """Runs the enumeration and reports the result (None on error)"""
+        import subprocess
+        cameras = None
+        try:
+            if self.key == CameraScanner.POWERSHELL_KEY:
+                cameras = enumerate_cameras_powershell(self.signals.status_updated.emit)
+            else:
+                cameras = enumerate_cameras_setupapi(
+                    (self.key,), lambda value: self.signals.progress_updated.emit(self.key, value),
+                    is_cancelled=self.cancelled.is_set
+                )
         except subprocess.TimeoutExpired:
-            print("Registry search timeout - using fallback")
+            self.signals.status_updated.emit("Timeout while scanning cameras")
         except Exception as e:
-            print(f"Registry search error: {e}")
-
-        return registry_paths
+            self.signals.status_updated.emit(f"Error while scanning: {str(e)}")
+        finally:
+            self.signals.completed.emit(self.key, cameras)
+            self.semaphore.release()
 
 
-class CameraScanner(QThread):
-    """Thread for scanning USB cameras"""
+class CameraScanner(QObject):
+    """Scans for USB cameras with one worker per device class on QThreadPool"""
     cameras_found = Signal(list)
     progress_updated = Signal(int)
     status_updated = Signal(str)
+    finished = Signal()
 
-    def run(self):
-        """Scans for connected USB cameras"""
-        try:
-            self.status_updated.emit("Scanning for USB cameras...")
-            cameras = []
-
-            # PowerShell command for camera detection with UTF-8 output
-            powershell_cmd = """
-            [Console]::OutputEncoding = [System.Text.Encoding]::UTF8
-            Get-PnpDevice | Where-Object {
-                $_.Class -eq 'Camera' -or 
-                $_.Class -eq 'Image' -or
-                ($_.HardwareID -like '*USB*' -and $_.FriendlyName -like '*camera*') -or
-                ($_.HardwareID -like '*USB*' -and $_.FriendlyName -like '*webcam*') -or
-                ($_.HardwareID -like '*USB*' -and $_.FriendlyName -like '*cam*')
-            } | Select-Object FriendlyName, InstanceId, HardwareID, Status | ConvertTo-Json -Depth 2
-            """
-
-            self.progress_updated.emit(25)
-
-            # Execute PowerShell with explicit UTF-8 encoding
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", powershell_cmd],
-                startupinfo=startupinfo,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=30
-            )
-
-            self.progress_updated.emit(50)
+    POWERSHELL_KEY = "powershell"
 
-            if result.returncode == 0 and result.stdout.strip():
-                try:
-                    devices_data = json.loads(result.stdout)
-                    if not isinstance(devices_data, list):
-                        devices_data = [devices_data]
-
-                    self.progress_updated.emit(75)
-
-                    for device in devices_data:
-                        if device and isinstance(device, dict):
-                            friendly_name = device.get('FriendlyName', 'Unknown')
-                            instance_id = device.get('InstanceId', '')
-                            hardware_id = device.get('HardwareID', [''])[0] if device.get('HardwareID') else ''
-                            status = device.get('Status', 'Unknown')
-
-                            # Construct registry path
-                            registry_path = f"SYSTEM\\CurrentControlSet\\Enum\\{instance_id}"
-
-                            camera = CameraDevice(
-                                name=friendly_name,
-                                device_id=instance_id,
-                                registry_path=registry_path,
-                                friendly_name=friendly_name,
-                                hardware_id=hardware_id,
-                                is_connected=(status == 'OK')
-                            )
-                            cameras.append(camera)
-
-                    self.progress_updated.emit(100)
-                    self.status_updated.emit(f"{len(cameras)} camera(s) found")
-
-                except json.JSONDecodeError as e:
-                    self.status_updated.emit(f"Error parsing camera data: {str(e)}")
-            else:
-                if result.stderr:
-                    self.status_updated.emit(f"PowerShell error: {result.stderr}")
-                else:
-                    self.status_updated.emit("No cameras found")
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Workers emit from pool threads, results are handled on the GUI thread
+        self._signals = ScanSignals()
+        self._signals.progress_updated.connect(self._on_worker_progress, Qt.ConnectionType.QueuedConnection)
+        self._signals.status_updated.connect(self.status_updated, Qt.ConnectionType.QueuedConnection)
+        self._signals.completed.connect(self._on_worker_completed, Qt.ConnectionType.QueuedConnection)
+        self._semaphore = QSemaphore(0)
+        self._cancelled = threading.Event()
+        self._keys: List[str] = []
+        self._progress = {}
+        self._results = {}
+        self._elapsed = QElapsedTimer()
+        self._expected_ms = 0
+        self._estimate_timer = QTimer(self)
+        self._estimate_timer.timeout.connect(self._on_estimate_timeout)
+
+    def start(self):
+        """Submits the enumeration workers to the global thread pool"""
+        try:
+            load_setupapi()
+            self._keys = list(CAMERA_CLASS_GUIDS)
+        except OSError:
+            # SetupAPI not available - fall back to a single PowerShell enumeration
+            self._keys = [self.POWERSHELL_KEY]
+
+        # Fresh semaphore and cancel flag per scan, workers of an earlier scan keep their own
+        self._semaphore = QSemaphore(0)
+        self._cancelled = threading.Event()
+        self._progress = dict.fromkeys(self._keys, 0)
+        self._results = {}
+        self.status_updated.emit("Scanning for USB cameras...")
+
+        self._elapsed.start()
+        if self._keys == [self.POWERSHELL_KEY]:
+            durations = self._load_durations()
+            if durations:
+                self._expected_ms = max(1, sorted(durations)[len(durations) // 2])
+                self._estimate_timer.start(max(1, self._expected_ms // SCAN_ESTIMATE_STEPS))
+
+        pool = QThreadPool.globalInstance()
+        for key in self._keys:
+            pool.start(CameraScanWorker(key, self._signals, self._semaphore, self._cancelled))
+
+    def isRunning(self) -> bool:
+        """True while at least one worker has not reported back"""
+        return len(self._results) < len(self._keys)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Blocks until all workers finished or the timeout expired"""
+        count = len(self._keys)
+        if not self._semaphore.tryAcquire(count, msecs):
+            return False
+        self._semaphore.release(count)
+        return True
+
+    def succeeded(self) -> bool:
+        """True if every worker of the last scan returned a result"""
+        return all(result is not None for result in self._results.values())
+
+    def cancel(self):
+        """Stops SetupAPI workers before their next device and aborts a running PowerShell enumeration"""
+        self._cancelled.set()
+        if self.POWERSHELL_KEY in self._keys and self.isRunning():
+            powershell_host.cancel()
+
+    def _on_worker_progress(self, key: str, value: int):
+        """Combines the per-worker progress into one value"""
+        self._progress[key] = value
+        self.progress_updated.emit(int(sum(self._progress.values()) / len(self._progress)))
+
+    def _on_estimate_timeout(self):
+        """Reports the estimated progress of a PowerShell scan"""
+        self.progress_updated.emit(min(SCAN_ESTIMATE_MAX, self._elapsed.elapsed() * 100 // self._expected_ms))
+
+    @staticmethod
+    def _load_durations() -> List[int]:
+        """Durations (ms) of the last PowerShell scans"""
+        value = QSettings().value("scan/powershell_durations_ms", "")
+        return [int(item) for item in str(value).split(",") if item.isdigit()]
+
+    def _record_duration(self):
+        """Adds the duration of the finished PowerShell scan to the history"""
+        durations = self._load_durations()[-(SCAN_DURATION_HISTORY - 1):] + [self._elapsed.elapsed()]
+        QSettings().setValue("scan/powershell_durations_ms", ",".join(map(str, durations)))
+
+    def _on_worker_completed(self, key: str, cameras: Optional[List[CameraDevice]]):
+        """Merges worker results and emits them once all workers are done"""
+        self._results[key] = cameras
+        if self.isRunning():
+            return
 
+        self._estimate_timer.stop()
+        if self._keys == [self.POWERSHELL_KEY] and cameras is not None and not self._cancelled.is_set():
+            self._record_duration()
+
+        # Merge in class order and drop devices reported more than once
+        merged = {}
+        for worker_key in self._keys:
+            for camera in self._results[worker_key] or []:
+                merged.setdefault(camera.device_id, camera)
+        cameras = list(merged.values())
+
+        self.progress_updated.emit(100)
+        # A cancelled scan only finishes, its partial result must not reach the table or the cache
+        if not self._cancelled.is_set():
+            if cameras:
+                self.status_updated.emit(f"{len(cameras)} camera(s) found")
+            elif self.succeeded():
+                self.status_updated.emit("No cameras found")
             self.cameras_found.emit(cameras)
-
-        except subprocess.TimeoutExpired:
-            self.status_updated.emit("Timeout while scanning cameras")
-            self.cameras_found.emit([])
-        except Exception as e:
-            self.status_updated.emit(f"Error while scanning: {str(e)}")
-            self.cameras_found.emit([])
+        self.finished.emit()
+
+
+# Donation buttons shared by the exit and about dialogs
+_COFFEE_BUTTON_STYLE = """
+QPushButton {
+    background-color: #ff813f;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 6px;
+    font-weight: bold;
+    font-size: 11px;
+}
+QPushButton:hover {
+    background-color: #ff9147;
+}
+QPushButton:pressed {
+    background-color: #e6732f;
+}
+"""
+_KOFI_BUTTON_STYLE = """
+QPushButton {
+    background-color: #29abe0;
+    color: white;
+    border: none;
+    padding: 8px 16px;
+    border-radius: 6px;
+    font-weight: bold;
+    font-size: 11px;
+}
+QPushButton:hover {
+    background-color: #31b8e8;
+}
+QPushButton:pressed {
+    background-color: #2399c7;
+}
+"""
+
+
+def _open_url(url: str):
+    """Opens URL in default browser"""
+    import webbrowser
+    webbrowser.open(url)
 
 
 class ExitDialog(QDialog):
@@ -941,13 +1602,13 @@ class ExitDialog(QDialog):
         # Title
         title = QLabel("ℹ️ Thank you for using CamRenamer!")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setFont(_emoji_font(16, QFont.Weight.Bold))
         layout.addWidget(title)
 
         # Main message
         message = QLabel("If you found this tool helpful, consider supporting its development:")
         message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message.setFont(QFont("Arial", 11))
+        message.setFont(_font(11))
         message.setStyleSheet("color: #cccccc; margin: 10px;")
         message.setWordWrap(True)
         layout.addWidget(message)
@@ -957,7 +1618,7 @@ class ExitDialog(QDialog):
 
         # Share option
         share_label = QLabel("• Share it with others")
-        share_label.setFont(QFont("Arial", 10))
+        share_label.setFont(_font(10))
         share_label.setStyleSheet("color: #ffffff; margin: 5px;")
         support_layout.addWidget(share_label)
 
@@ -965,13 +1626,13 @@ class ExitDialog(QDialog):
         github_label = QLabel('• Leave a star on the <a href="https://github.com/oe7set/camrenamer" style="color: #4a90e2; text-decoration: none;">🐙 GitHub Repository</a>')
         github_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
         github_label.setOpenExternalLinks(True)
-        github_label.setFont(QFont("Arial", 10))
+        github_label.setFont(_font(10))
         github_label.setStyleSheet("color: #ffffff; margin: 5px;")
         support_layout.addWidget(github_label)
 
         # Donation text
         donation_text = QLabel("• Consider a donation ☕❤️")
-        donation_text.setFont(QFont("Arial", 10))
+        donation_text.setFont(_font(10))
         donation_text.setStyleSheet("color: #ffffff; margin: 5px;")
         support_layout.addWidget(donation_text)
 
@@ -984,47 +1645,15 @@ class ExitDialog(QDialog):
         # Buy Me A Coffee button
         coffee_button = QPushButton("☕ Buy Me A Coffee")
         coffee_button.setMinimumHeight(35)
-        coffee_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff813f;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #ff9147;
-            }
-            QPushButton:pressed {
-                background-color: #e6732f;
-            }
-        """)
-        coffee_button.clicked.connect(lambda: self.open_url("https://www.buymeacoffee.com/oe7set"))
+        coffee_button.setStyleSheet(_COFFEE_BUTTON_STYLE)
+        coffee_button.clicked.connect(lambda: _open_url("https://www.buymeacoffee.com/oe7set"))
         donation_buttons_layout.addWidget(coffee_button)
 
         # Ko-fi button
         kofi_button = QPushButton("💙 Ko-fi")
         kofi_button.setMinimumHeight(35)
-        kofi_button.setStyleSheet("""
-            QPushButton {
-                background-color: #29abe0;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #31b8e8;
-            }
-            QPushButton:pressed {
-                background-color: #2399c7;
-            }
-        """)
-        kofi_button.clicked.connect(lambda: self.open_url("https://ko-fi.com/O5O31L3XGA"))
+        kofi_button.setStyleSheet(_KOFI_BUTTON_STYLE)
+        kofi_button.clicked.connect(lambda: _open_url("https://ko-fi.com/O5O31L3XGA"))
         donation_buttons_layout.addWidget(kofi_button)
 
         layout.addLayout(donation_buttons_layout)
@@ -1032,7 +1661,7 @@ class ExitDialog(QDialog):
         # Exit message
         exit_message = QLabel("The application will now exit.")
         exit_message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        exit_message.setFont(QFont("Arial", 10))
+        exit_message.setFont(_font(10))
         exit_message.setStyleSheet("color: #aaaaaa; margin: 15px 5px 5px 5px;")
         layout.addWidget(exit_message)
 
@@ -1062,11 +1691,6 @@ class ExitDialog(QDialog):
 
         self.setLayout(layout)
 
-    def open_url(self, url):
-        """Opens URL in default browser"""
-        import webbrowser
-        webbrowser.open(url)
-
 
 class BackupThread(QThread):
     """Thread for creating registry backups without blocking UI"""
@@ -1102,6 +1726,7 @@ class BackupThread(QThread):
 
     def create_registry_backup(self, camera: CameraDevice, registry_paths: List[str]) -> str:
         """Creates a backup .reg file for the camera registry entries - optimized version"""
+        import subprocess
         try:
             self.progress_updated.emit("Create Backup-File...")
 
@@ -1116,85 +1741,18 @@ class BackupThread(QThread):
 
             self.progress_updated.emit("Reading Registry-entries...")
 
-            # Create single PowerShell script that processes all paths at once
-            paths_array = "', '".join([path.replace('"', '').strip() for path in registry_paths])
-
-            powershell_cmd = f"""
-            $paths = @('{paths_array}')
-
-            foreach ($regPath in $paths) {{
-                $fullPath = "HKLM:\\$regPath"
-                if (Test-Path $fullPath) {{
-                    try {{
-                        $key = Get-Item $fullPath -ErrorAction SilentlyContinue
-                        if ($key) {{
-                            Write-Output "[HKEY_LOCAL_MACHINE\\$regPath]"
-
-                            $key.GetValueNames() | ForEach-Object {{
-                                $valueName = $_
-                                $value = $key.GetValue($valueName)
-                                $valueType = $key.GetValueKind($valueName)
-
-                                if ($valueName -eq "") {{
-                                    $regValueName = "@"
-                                }} else {{
-                                    $regValueName = "`"$valueName`""
-                                }}
-
-                                switch ($valueType) {{
-                                    "String" {{
-                                        $escapedValue = $value -replace '\\\\', '\\\\\\\\' -replace '"', '\\"'
-                                        Write-Output "$regValueName=`"$escapedValue`""
-                                    }}
-                                    "DWord" {{
-                                        $hexValue = [System.Convert]::ToString([int]$value, 16).PadLeft(8, '0')
-                                        Write-Output "$regValueName=dword:$hexValue"
-                                    }}
-                                    "QWord" {{
-                                        $hexValue = [System.Convert]::ToString([long]$value, 16).PadLeft(16, '0')
-                                        Write-Output "$regValueName=qword:$hexValue"
-                                    }}
-                                    "Binary" {{
-                                        $hexString = ($value | ForEach-Object {{ [System.Convert]::ToString($_, 16).PadLeft(2, '0') }}) -join ','
-                                        Write-Output "$regValueName=hex:$hexString"
-                                    }}
-                                    "MultiString" {{
-                                        $hexBytes = [System.Text.Encoding]::Unicode.GetBytes(($value -join "`0") + "`0`0")
-                                        $hexString = ($hexBytes | ForEach-Object {{ [System.Convert]::ToString($_, 16).PadLeft(2, '0') }}) -join ','
-                                        Write-Output "$regValueName=hex(7):$hexString"
-                                    }}
-                                    "ExpandString" {{
-                                        $hexBytes = [System.Text.Encoding]::Unicode.GetBytes($value + "`0")
-                                        $hexString = ($hexBytes | ForEach-Object {{ [System.Convert]::ToString($_, 16).PadLeft(2, '0') }}) -join ','
-                                        Write-Output "$regValueName=hex(2):$hexString"
-                                    }}
-                                }}
-                            }}
-                            Write-Output ""
-                        }}
-                    }} catch {{
-                        Write-Output "; Error accessing: $regPath"
-                        Write-Output ""
-                    }}
-                }} else {{
-                    Write-Output "; Registry key not found: $regPath"
-                    Write-Output ""
-                }}
-            }}
-            """
-
             self.progress_updated.emit("Running Registry backup...")
 
             # Single PowerShell execution for all paths
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", powershell_cmd],
-                startupinfo=startupinfo,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=60
-            )
+            paths = [path.replace('"', '').strip() for path in registry_paths]
+            output = ""
+            error = None
+            try:
+                output = powershell_host.run(BACKUP_REGISTRY_SCRIPT, *paths, timeout=60)
+            except subprocess.TimeoutExpired:
+                error = "PowerShell did not answer within 60 seconds"
+            except RuntimeError as e:
+                error = str(e)
 
             self.progress_updated.emit("Writing backup file...")
 
@@ -1206,19 +1764,59 @@ class BackupThread(QThread):
                 f.write(f'; Device ID: {camera.device_id}\n')
                 f.write(f'; Hardware ID: {camera.hardware_id}\n\n')
 
-                if result.returncode == 0 and result.stdout.strip():
-                    f.write(result.stdout)
+                if error is None and output.strip():
+                    f.write(output)
                 else:
-                    f.write(f'; Error during backup: {result.stderr}\n')
+                    f.write(f'; Error during backup: {error}\n')
 
             self.progress_updated.emit("Backup created successfully!")
             return backup_path
 
-        except Exception as e:
-            print(f"Error creating backup: {e}")
+        except Exception:
+            log.exception("Error creating backup")
             return ""
 
 
+class RenameThread(QThread):
+    """Thread for writing the new camera name to all registry paths without blocking UI"""
+    rename_completed = Signal(int, bool)
+
+    def __init__(self, hklm, device_id: str, registry_paths: List[str], new_name: str):
+        super().__init__()
+        self.hklm = hklm
+        self.device_id = device_id
+        self.registry_paths = registry_paths
+        self.new_name = new_name
+
+    def run(self):
+        """Writes all paths concurrently, emits the success count"""
+        import concurrent.futures
+        success_count = 0
+
+        # Open and write all registry paths concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(len(self.registry_paths), 8))) as pool:
+            futures = {
+                pool.submit(_try_open_and_set, self.hklm, registry_path, self.new_name): registry_path
+                for registry_path in self.registry_paths
+            }
+            for future in concurrent.futures.as_completed(futures):
+                if future.result():
+                    success_count += 1
+
+        # Nothing written, try the device's interface keys below DeviceClasses directly
+        if success_count == 0:
+            for registry_path in find_device_class_paths(self.hklm, self.device_id):
+                if registry_path not in self.registry_paths and _try_open_and_set(self.hklm, registry_path, self.new_name):
+                    success_count += 1
+
+        # Restart the device so the new name shows up without a system restart
+        restarted = success_count > 0 and restart_device(self.device_id)
+        if success_count > 0 and not restarted:
+            log.debug("Could not restart %s", self.device_id)
+
+        self.rename_completed.emit(success_count, restarted)
+
+
 class AboutDialog(QDialog):
     """About dialog"""
 
@@ -1233,26 +1831,26 @@ class AboutDialog(QDialog):
         # Title
         title = QLabel("CamRenamer")
         title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title.setFont(_font(20, QFont.Weight.Bold))
         layout.addWidget(title)
 
         # Version
         version = QLabel("Version 1.1")
         version.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        version.setFont(QFont("Arial", 12))
+        version.setFont(_font(12))
         layout.addWidget(version)
 
         # Author
         author = QLabel("© 2025 OE7SET - Erwin Spitaler")
         author.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        author.setFont(QFont("Arial", 10))
+        author.setFont(_font(10))
         layout.addWidget(author)
 
         # GitHub Link
         github_label = QLabel('<a href="https://github.com/oe7set/camrenamer" style="color: #4a90e2; text-decoration: none;">🐙 GitHub Repository</a>')
         github_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         github_label.setOpenExternalLinks(True)
-        github_label.setFont(QFont("Arial", 11))
+        github_label.setFont(_font(11))
         layout.addWidget(github_label)
 
         # Description
@@ -1276,7 +1874,7 @@ class AboutDialog(QDialog):
 
         donation_text = QLabel("If you find this tool useful, consider supporting its development:")
         donation_text.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        donation_text.setFont(QFont("Arial", 10))
+        donation_text.setFont(_font(10))
         donation_text.setStyleSheet("color: #cccccc; margin: 5px;")
         donation_layout.addWidget(donation_text)
 
@@ -1286,47 +1884,15 @@ class AboutDialog(QDialog):
         # Buy Me A Coffee button
         coffee_button = QPushButton("☕ Buy Me A Coffee")
         coffee_button.setMinimumHeight(35)
-        coffee_button.setStyleSheet("""
-            QPushButton {
-                background-color: #ff813f;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #ff9147;
-            }
-            QPushButton:pressed {
-                background-color: #e6732f;
-            }
-        """)
-        coffee_button.clicked.connect(lambda: self.open_url("https://www.buymeacoffee.com/oe7set"))
+        coffee_button.setStyleSheet(_COFFEE_BUTTON_STYLE)
+        coffee_button.clicked.connect(lambda: _open_url("https://www.buymeacoffee.com/oe7set"))
         buttons_layout.addWidget(coffee_button)
 
         # Ko-fi button
         kofi_button = QPushButton("💙 Ko-fi")
         kofi_button.setMinimumHeight(35)
-        kofi_button.setStyleSheet("""
-            QPushButton {
-                background-color: #29abe0;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 11px;
-            }
-            QPushButton:hover {
-                background-color: #31b8e8;
-            }
-            QPushButton:pressed {
-                background-color: #2399c7;
-            }
-        """)
-        kofi_button.clicked.connect(lambda: self.open_url("https://ko-fi.com/O5O31L3XGA"))
+        kofi_button.setStyleSheet(_KOFI_BUTTON_STYLE)
+        kofi_button.clicked.connect(lambda: _open_url("https://ko-fi.com/O5O31L3XGA"))
         buttons_layout.addWidget(kofi_button)
 
         donation_layout.addLayout(buttons_layout)
@@ -1340,58 +1906,167 @@ class AboutDialog(QDialog):
 
         self.setLayout(layout)
 
-    def open_url(self, url):
-        """Opens URL in default browser"""
-        import webbrowser
-        webbrowser.open(url)
 
+def _shorten(text: str, limit: int) -> str:
+    """Cuts text to limit characters and appends an ellipsis if it is longer"""
+    return text[:limit] + "..." if len(text) > limit else text
 
-class ProportionalHeaderView(QHeaderView):
-    """Custom header view that maintains proportional column widths"""
 
-    def __init__(self, orientation, parent=None):
-        super().__init__(orientation, parent)
-        self._proportions = []
-        self._initial_widths_set = False
+class CameraModel(QAbstractTableModel):
+    """Table model for the found cameras, stores one list of display texts per column"""
 
-    def setProportionalWidths(self, widths):
-        """Set the proportional widths for columns"""
-        total = sum(widths)
-        self._proportions = [w / total for w in widths]
-        self._initial_widths_set = True
-        self._updateColumnWidths()
-
-    def _updateColumnWidths(self):
-        """Update column widths based on current table width and proportions"""
-        if not self._proportions or not self._initial_widths_set:
-            return
+    HEADERS = ["🎥 Camera Name", "🔧 Device ID", "💾 Hardware ID", "🔌 Status", "⚙️ Actions"]
 
-        # Get available width (subtract margins and scrollbar)
-        available_width = self.parent().width() - 50
-        if available_width <= 0:
-            return
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cameras: List[CameraDevice] = []
+        self._columns: List[List[str]] = [[] for _ in self.HEADERS]
+        self._roles = {
+            Qt.ItemDataRole.DisplayRole: self._display,
+            Qt.ItemDataRole.ToolTipRole: self._tooltip,
+            Qt.ItemDataRole.UserRole: self._camera,
+        }
 
-        # Calculate new widths based on proportions
-        for i, proportion in enumerate(self._proportions):
-            new_width = int(available_width * proportion)
-            if i < self.count():
-                self.resizeSection(i, max(new_width, 50))  # Minimum width of 50px
+    @staticmethod
+    def _display_row(camera: CameraDevice) -> tuple:
+        """Texts shown for a camera, one per column, long IDs are shortened"""
+        return (
+            camera.friendly_name,
+            _shorten(camera.device_id, DEVICE_ID_DISPLAY_LENGTH),
+            _shorten(camera.hardware_id, HARDWARE_ID_DISPLAY_LENGTH),
+            "🟢 Connected" if camera.is_connected else "🔴 Disconnected",
+            "👆 Select to rename",
+        )
 
-    def resizeEvent(self, event):
-        """Handle resize events to maintain proportions"""
-        super().resizeEvent(event)
-        if self._initial_widths_set:
-            QTimer.singleShot(10, self._updateColumnWidths)  # Small delay for smooth resizing
+    def set_cameras(self, cameras: List[CameraDevice]):
+        """Replaces the model contents with the given cameras"""
+        self.beginResetModel()
+        self._cameras = list(cameras)
+        rows = [self._display_row(camera) for camera in cameras]
+        self._columns = [list(column) for column in zip(*rows, strict=True)] if rows else [[] for _ in self.HEADERS]
+        self.endResetModel()
+
+    def update_camera(self, row: int, camera: CameraDevice):
+        """Replaces the camera shown in a single row"""
+        self._cameras[row] = camera
+        for column, text in zip(self._columns, self._display_row(camera), strict=True):
+            column[row] = text
+        self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+
+    def merge_cameras(self, cameras: List[CameraDevice]):
+        """Updates only the changed rows if the same devices are listed, otherwise resets the model"""
+        if [camera.device_id for camera in cameras] != [camera.device_id for camera in self._cameras]:
+            self.set_cameras(cameras)
+            return
+        for row, (old, new) in enumerate(zip(self._cameras, cameras, strict=True)):
+            if old != new:
+                self.update_camera(row, new)
+
+    def clear(self):
+        """Removes all cameras from the model"""
+        self.set_cameras([])
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self._cameras)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        handler = self._roles.get(role)
+        if handler is None or not index.isValid():
+            return None
+        return handler(index.row(), index.column())
+
+    def _camera(self, row: int, column: int) -> CameraDevice:
+        """Camera shown in a row, for every column"""
+        return self._cameras[row]
+
+    def _display(self, row: int, column: int) -> str:
+        """Text shown in a cell"""
+        return self._columns[column][row]
+
+    def _tooltip(self, row: int, column: int) -> Optional[str]:
+        """Tooltip for a cell, IDs only get one when their text is truncated"""
+        if column == 1:
+            device_id = self._cameras[row].device_id
+            return device_id if self._columns[1][row] != device_id else None
+        if column == 2:
+            hardware_id = self._cameras[row].hardware_id
+            return hardware_id if self._columns[2][row] != hardware_id else None
+        if column == 3:
+            return "Status: Active and ready" if self._cameras[row].is_connected else "Status: Not available"
+        if column == 4:
+            return "Click this row to select the camera"
+        return None
+
+
+# Emoji icons rasterized once per process
+_ICONS: dict[str, QIcon] = {}
+_ICON_FONT = QFont("Segoe UI Emoji", 20)
+
+
+def _get_icon(char: str) -> QIcon:
+    """Returns a cached icon showing the given emoji"""
+    icon = _ICONS.get(char)
+    if icon is None:
+        image = QImage(32, 32, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(image)
+        painter.setFont(_ICON_FONT)
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, char)
+        painter.end()
+        icon = _ICONS[char] = QIcon(QPixmap.fromImage(image))
+    return icon
+
+
+@cache
+def load_stylesheet() -> str:
+    """Dark theme style sheet for the main window, read once from the Qt resources"""
+    file = QFile(":/styles.qss")
+    if not file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text):
+        log.warning("Could not load style sheet: %s", file.errorString())
+        return ""
+    try:
+        return bytes(file.readAll()).decode("utf-8")
+    finally:
+        file.close()
 
 
 class CamRenamerMainWindow(QMainWindow):
     """Main window of the application"""
+    first_shown = Signal()
 
     def __init__(self):
         super().__init__()
         self.cameras: List[CameraDevice] = []
-        self.scanner_thread: Optional[CameraScanner] = None
         self.successful_rename_occurred = False  # Track if any successful rename happened
+        self._shown = False
+
+        # Last scan result, reused while the set of present camera devices is unchanged
+        self._device_set_hash: Optional[int] = None
+        self._pending_device_set_hash: Optional[int] = None
+        self._cached_cameras: List[CameraDevice] = []
+        self._cache_time: Optional[float] = None
+        self._rename_in_progress = False
+
+        # Registry paths of already renamed cameras, keyed by device ID
+        self._registry_paths_cache: dict[str, List[str]] = {}
+
+        # One scanner for the lifetime of the window, every scan reuses it
+        self.scanner = CameraScanner(self)
+        self.scanner.cameras_found.connect(self.on_cameras_found)
+        self.scanner.progress_updated.connect(self.on_scan_progress)
+        self.scanner.status_updated.connect(self.statusBar().showMessage)
+        self.scanner.finished.connect(self.on_scan_finished)
+
+        # HKLM handle reused for all registry writes
+        self._hklm = winreg.ConnectRegistry(None, winreg.HKEY_LOCAL_MACHINE)
 
         self.setWindowTitle("CamRenamer - USB Camera Manager v1.1")
         self.setMinimumSize(640, 480)
@@ -1409,322 +2084,25 @@ class CamRenamerMainWindow(QMainWindow):
         # Enable Enter key for renaming
         self.new_name_edit.returnPressed.connect(self.rename_selected_camera)
 
-        # Initial scan after short delay
-        QTimer.singleShot(500, self.scan_cameras)
-
-    def apply_modern_style(self):
-        """Applies a modern dark theme"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-
-            QTableWidget {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                gridline-color: #555555;
-                color: #ffffff;
-                selection-background-color: #4a90e2;
-                alternate-background-color: #404040;
-            }
-
-            QTableWidget::item {
-                padding: 8px;
-                border-bottom: 1px solid #555555;
-            }
-
-            QTableWidget::item:selected {
-                background-color: #4a90e2;
-                color: white;
-            }
+        # Get notified about camera plug/unplug to invalidate the scan cache and rescan
+        self._rescan_timer = QTimer(self)
+        self._rescan_timer.setSingleShot(True)
+        self._rescan_timer.setInterval(DEVICE_CHANGE_RESCAN_DELAY_MS)
+        self._rescan_timer.timeout.connect(self._on_device_change_timeout)
+        self._device_notification = register_device_notification(int(self.winId()))
 
-            QHeaderView::section {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                padding: 12px;
-                border: none;
-                border-right: 1px solid #555555;
-                border-bottom: 1px solid #555555;
-                font-weight: bold;
-                font-size: 11px;
-            }
+        # Show the cameras of the last scan until the first rescan completes
+        self._load_cache()
 
-            QHeaderView::section:hover {
-                background-color: #4a90e2;
-            }
-
-            QTableWidget QHeaderView {
-                background-color: #3c3c3c;
-            }
-
-            QTableWidget QHeaderView::section {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                padding: 1px 12px;
-                border: none;
-                border-right: 1px solid #555555;
-                border-bottom: 1px solid #555555;
-                font-weight: bold;
-                font-size: 14px;
-            }
+        # Initial scan once the window is on screen, queued so the first paint is not delayed
+        self.first_shown.connect(self.scan_cameras, Qt.ConnectionType.QueuedConnection)
 
-            QTableWidget QHeaderView::section:hover {
-                background-color: #4a90e2;
-            }
-
-            QTableWidget QTableCornerButton::section {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-            }
-
-            QTableCornerButton::section {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-            }
-
-            QPushButton {
-                background-color: #4a90e2;
-                color: white;
-                border: none;
-                padding: 12px 20px;
-                border-radius: 6px;
-                font-weight: bold;
-                min-width: 100px;
-                font-size: 12px;
-            }
-
-            QPushButton:hover {
-                background-color: #5ba0f2;
-            }
-
-            QPushButton:pressed {
-                background-color: #3a80d2;
-            }
-
-            QPushButton:disabled {
-                background-color: #666666;
-                color: #aaaaaa;
-            }
-
-            QLineEdit {
-                background-color: #3c3c3c;
-                border: 2px solid #555555;
-                border-radius: 6px;
-                padding: 10px;
-                color: #ffffff;
-                font-size: 12px;
-            }
-
-            QLineEdit:focus {
-                border-color: #4a90e2;
-                background-color: #454545;
-            }
-
-            QLabel {
-                color: #ffffff;
-                font-size: 12px;
-            }
-
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #555555;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 15px;
-                color: #ffffff;
-                font-size: 13px;
-            }
-
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 15px;
-                padding: 0 8px 0 8px;
-            }
-
-            QProgressBar {
-                border: 2px solid #555555;
-                border-radius: 6px;
-                background-color: #3c3c3c;
-                color: #ffffff;
-                text-align: center;
-                font-weight: bold;
-            }
-
-            QProgressBar::chunk {
-                background-color: #4a90e2;
-                border-radius: 4px;
-            }
-
-            QStatusBar {
-                background-color: #404040;
-                color: #ffffff;
-                border-top: 1px solid #555555;
-                font-size: 11px;
-            }
-
-            QToolBar {
-                background-color: #404040;
-                border: none;
-                spacing: 6px;
-                padding: 6px;
-                color: #ffffff;
-            }
-
-            QToolBar QToolButton {
-                color: #ffffff;
-                background-color: transparent;
-                border: none;
-                padding: 4px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: normal;
-                min-width: 80px;
-            }
-
-            QToolBar QToolButton:hover {
-                background-color: #4a90e2;
-                color: #ffffff;
-            }
-
-            QToolBar QToolButton:pressed {
-                background-color: #3a80d2;
-                color: #ffffff;
-            }
-
-            QMenuBar {
-                background-color: #404040;
-                color: #ffffff;
-                border-bottom: 1px solid #555555;
-            }
-
-            QMenuBar::item {
-                padding: 8px 12px;
-                background-color: transparent;
-            }
-
-            QMenuBar::item:selected {
-                background-color: #4a90e2;
-                border-radius: 4px;
-            }
-
-            QMenu {
-                background-color: #3c3c3c;
-                color: #ffffff;
-                border: 1px solid #555555;
-                border-radius: 4px;
-            }
-
-            QMenu::item {
-                padding: 8px 20px;
-            }
-
-            QMenu::item:selected {
-                background-color: #4a90e2;
-            }
-
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-
-            QTextEdit {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                color: #ffffff;
-                padding: 8px;
-            }
-
-            /* Scrollbar Styles for Dark Theme */
-            QTableWidget QScrollBar:vertical {
-                background-color: #2b2b2b;
-                width: 16px;
-                border: 1px solid #555555;
-                border-radius: 8px;
-                margin: 0px;
-            }
-
-            QTableWidget QScrollBar::handle:vertical {
-                background-color: #4a90e2;
-                min-height: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-
-            QTableWidget QScrollBar::handle:vertical:hover {
-                background-color: #5ba0f2;
-            }
-
-            QTableWidget QScrollBar::handle:vertical:pressed {
-                background-color: #3a80d2;
-            }
-
-            QTableWidget QScrollBar::add-line:vertical,
-            QTableWidget QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-
-            QTableWidget QScrollBar::up-arrow:vertical,
-            QTableWidget QScrollBar::down-arrow:vertical {
-                background: none;
-                border: none;
-            }
-
-            QTableWidget QScrollBar::add-page:vertical,
-            QTableWidget QScrollBar::sub-page:vertical {
-                background: none;
-            }
-
-            QTableWidget QScrollBar:horizontal {
-                background-color: #2b2b2b;
-                height: 16px;
-                border: 1px solid #555555;
-                border-radius: 8px;
-                margin: 0px;
-            }
-
-            QTableWidget QScrollBar::handle:horizontal {
-                background-color: #4a90e2;
-                min-width: 20px;
-                border-radius: 6px;
-                margin: 2px;
-            }
-
-            QTableWidget QScrollBar::handle:horizontal:hover {
-                background-color: #5ba0f2;
-            }
-
-            QTableWidget QScrollBar::handle:horizontal:pressed {
-                background-color: #3a80d2;
-            }
-
-            QTableWidget QScrollBar::add-line:horizontal,
-            QTableWidget QScrollBar::sub-line:horizontal {
-                border: none;
-                background: none;
-                width: 0px;
-            }
-
-            QTableWidget QScrollBar::left-arrow:horizontal,
-            QTableWidget QScrollBar::right-arrow:horizontal {
-                background: none;
-                border: none;
-            }
-
-            QTableWidget QScrollBar::add-page:horizontal,
-            QTableWidget QScrollBar::sub-page:horizontal {
-                background: none;
-            }
-
-            /* Corner widget between scrollbars */
-            QTableWidget QScrollBar::corner {
-                background-color: #2b2b2b;
-                border: 1px solid #555555;
-            }
-        """)
+    def apply_modern_style(self):
+        """Applies the modern dark theme to the whole application"""
+        app = QApplication.instance()
+        stylesheet = load_stylesheet()
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
 
     def setup_menu_and_toolbar(self):
         """Creates menu and toolbar"""
@@ -1734,15 +2112,15 @@ class CamRenamerMainWindow(QMainWindow):
         # File Menu
         file_menu = menubar.addMenu("&File")
 
-        refresh_action = QAction("🔄 &Refresh", self)
+        refresh_action = QAction(_get_icon("🔄"), "&Refresh", self)
         refresh_action.setShortcut("F5")
         refresh_action.setStatusTip("Reload camera list")
-        refresh_action.triggered.connect(self.scan_cameras)
+        refresh_action.triggered.connect(lambda: self.scan_cameras())
         file_menu.addAction(refresh_action)
 
         file_menu.addSeparator()
 
-        exit_action = QAction("❌ &Exit", self)
+        exit_action = QAction(_get_icon("❌"), "&Exit", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.setStatusTip("Exit application")
         exit_action.triggered.connect(self.close)
@@ -1751,7 +2129,7 @@ class CamRenamerMainWindow(QMainWindow):
         # Tools Menu
         tools_menu = menubar.addMenu("&Tools")
 
-        clear_action = QAction("🧹 &Clear table", self)
+        clear_action = QAction(_get_icon("🧹"), "&Clear table", self)
         clear_action.setShortcut("Ctrl+L")
         clear_action.setStatusTip("Clear camera table")
         clear_action.triggered.connect(self.clear_table)
@@ -1760,7 +2138,7 @@ class CamRenamerMainWindow(QMainWindow):
         # Help Menu
         help_menu = menubar.addMenu("&Help")
 
-        about_action = QAction("ℹ️ &About", self)
+        about_action = QAction(_get_icon("ℹ️"), "&About", self)
         about_action.setShortcut("F1")
         about_action.setStatusTip("About this application")
         about_action.triggered.connect(self.show_about)
@@ -1768,6 +2146,7 @@ class CamRenamerMainWindow(QMainWindow):
 
         # Toolbar
         toolbar = QToolBar("Main Toolbar")
+        toolbar.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self.addToolBar(toolbar)
 
         toolbar.addAction(refresh_action)
@@ -1792,13 +2171,13 @@ class CamRenamerMainWindow(QMainWindow):
         header_layout = QHBoxLayout()
 
         title_label = QLabel("🎥 USB Camera Manager")
-        title_label.setFont(QFont("Arial", 20, QFont.Weight.Bold))
+        title_label.setFont(_emoji_font(20, QFont.Weight.Bold))
         header_layout.addWidget(title_label)
 
         header_layout.addStretch()
 
         self.scan_button = QPushButton("🔄 Scan cameras")
-        self.scan_button.clicked.connect(self.scan_cameras)
+        self.scan_button.clicked.connect(lambda: self.scan_cameras())
         self.scan_button.setMinimumHeight(40)
         header_layout.addWidget(self.scan_button)
 
@@ -1814,36 +2193,33 @@ class CamRenamerMainWindow(QMainWindow):
         camera_group = QGroupBox("📋 Found USB Cameras")
         camera_layout = QVBoxLayout(camera_group)
 
-        self.camera_table = QTableWidget()
-        self.camera_table.setColumnCount(5)
-        self.camera_table.setHorizontalHeaderLabels([
-            "🎥 Camera Name", "🔧 Device ID", "💾 Hardware ID", "🔌 Status", "⚙️ Actions"
-        ])
-
-        # Use custom proportional header view
-        proportional_header = ProportionalHeaderView(Qt.Orientation.Horizontal, self.camera_table)
-        self.camera_table.setHorizontalHeader(proportional_header)
+        self.camera_model = CameraModel(self)
+        self.camera_table = QTableView()
+        self.camera_table.setModel(self.camera_model)
+        self._sel_model = self.camera_table.selectionModel()
 
-        # Set proportional widths: Camera Name(20%), Device ID(30%), Hardware ID(25%), Status(12%), Actions(13%)
-        proportional_header.setProportionalWidths([200, 300, 250, 120, 130])
-
-        # Disable column moving but allow manual resizing
-        proportional_header.setSectionsMovable(False)
-        proportional_header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        # Let Qt stretch the text columns to the table width, Status and Actions keep a fixed width
+        header = self.camera_table.horizontalHeader()
+        header.setSectionsMovable(False)
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        for column, width in ((3, 120), (4, 130)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
 
         # Table behavior settings
         self.camera_table.setAlternatingRowColors(True)
-        self.camera_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.camera_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # Disable editing
+        self.camera_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.camera_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Disable editing
         self.camera_table.setTextElideMode(Qt.TextElideMode.ElideMiddle)  # Enable text selection with ellipsis
         self.camera_table.setMinimumHeight(50)
 
         # Horizontales Scrollen aktivieren
         self.camera_table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.camera_table.setHorizontalScrollMode(QTableWidget.ScrollMode.ScrollPerPixel)
+        self.camera_table.setHorizontalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
 
         # Enable text selection in individual cells
-        self.camera_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.camera_table.setSelectionMode(QTableView.SelectionMode.ExtendedSelection)
 
         camera_layout.addWidget(self.camera_table)
         main_layout.addWidget(camera_group)
@@ -1878,24 +2254,12 @@ class CamRenamerMainWindow(QMainWindow):
         main_layout.addWidget(rename_group)
 
         # Table selection event
-        self.camera_table.itemSelectionChanged.connect(self.on_camera_selection_changed)
-
-    def resizeEvent(self, event):
-        """Handle window resize events to update table column proportions"""
-        super().resizeEvent(event)
-        # Trigger proportional resize with a small delay
-        QTimer.singleShot(50, self._updateTableColumnWidths)
-
-    def _updateTableColumnWidths(self):
-        """Update table column widths proportionally"""
-        header = self.camera_table.horizontalHeader()
-        if hasattr(header, '_updateColumnWidths'):
-            header._updateColumnWidths()
+        self._sel_model.selectionChanged.connect(self.on_camera_selection_changed)
 
     def clear_table(self):
         """Clears the camera table"""
         self.cameras.clear()
-        self.camera_table.setRowCount(0)
+        self.camera_model.clear()
         self.new_name_edit.clear()
         self.rename_button.setEnabled(False)
         self.statusBar().showMessage("Table cleared")
@@ -1907,83 +2271,57 @@ class CamRenamerMainWindow(QMainWindow):
 
     def on_camera_selection_changed(self):
         """Called when a camera is selected"""
-        selected_rows = self.camera_table.selectionModel().selectedRows()
+        selected_rows = self._sel_model.selectedRows()
 
         if selected_rows:
-            row = selected_rows[0].row()
-            if row < len(self.cameras):
-                camera = self.cameras[row]
-                self.new_name_edit.setText(camera.friendly_name)
-                self.rename_button.setEnabled(True)
-                self.statusBar().showMessage(f"Camera selected: {camera.friendly_name}")
-                self.new_name_edit.setFocus()
-                self.new_name_edit.selectAll()
-            else:
-                self.rename_button.setEnabled(False)
+            camera = selected_rows[0].data(Qt.ItemDataRole.UserRole)
+            self.new_name_edit.setText(camera.friendly_name)
+            self.rename_button.setEnabled(True)
+            self.statusBar().showMessage(f"Camera selected: {camera.friendly_name}")
+            self.new_name_edit.setFocus()
+            self.new_name_edit.selectAll()
         else:
             self.rename_button.setEnabled(False)
             self.new_name_edit.clear()
             self.statusBar().showMessage("Ready")
 
     def scan_cameras(self):
-        """Starts the camera scan"""
-        if self.scanner_thread and self.scanner_thread.isRunning():
+        """Starts the camera scan unless the cached result is still valid"""
+        if self.scanner.isRunning() or self._rename_in_progress:
             return
 
-        self.scan_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setValue(0)
-
-        # Visual progress timer for smooth animation
-        self.visual_progress = 0
-        self.scan_completed = False
-
-        self.visual_timer = QTimer()
-        self.visual_timer.timeout.connect(self.update_visual_progress)
-        self.visual_timer.start(100)  # Update every 100ms
-
-        self.scanner_thread = CameraScanner()
-        self.scanner_thread.cameras_found.connect(self.on_cameras_found)
-        self.scanner_thread.progress_updated.connect(self.progress_bar.setValue)
-        self.scanner_thread.status_updated.connect(self.statusBar().showMessage)
-        self.scanner_thread.finished.connect(self.on_scan_finished)
-        self.scanner_thread.start()
-
-    def update_visual_progress(self):
-        """Updates visual progress with smooth animation"""
-        if self.scan_completed:
-            # Fast completion when scan is done
-            if self.visual_progress < 100:
-                self.visual_progress = min(100, self.visual_progress + 10)
-                self.progress_bar.setValue(self.visual_progress)
-            else:
-                self.visual_timer.stop()
+        # Reuse a result that is only a few seconds old without querying the devices
+        if self._cache_time is not None and time.monotonic() - self._cache_time < SCAN_CACHE_TTL:
+            self.on_cameras_found(list(self._cached_cameras))
+            self.statusBar().showMessage(f"{len(self._cached_cameras)} camera(s) found (cached)")
             return
 
-        # Normal progress animation
-        if self.visual_progress < 90:
-            # Fast progress until 90%
-            self.visual_progress = min(90, self.visual_progress + 2.2)
-        else:
-            # Slower progress after 90%
-            if self.visual_progress < 98:
-                self.visual_progress = min(98, self.visual_progress + 0.2)
+        # Skip the full scan if the set of present camera devices did not change
+        try:
+            device_set_hash = hash(tuple(get_camera_device_ids()))
+        except OSError:
+            device_set_hash = None
 
-        self.progress_bar.setValue(int(self.visual_progress))
+        if device_set_hash is not None and device_set_hash == self._device_set_hash:
+            self.on_cameras_found(list(self._cached_cameras))
+            self.statusBar().showMessage(f"{len(self._cached_cameras)} camera(s) found (unchanged)")
+            return
 
-    def on_real_progress_updated(self, value):
-        """Handle real progress updates from scanner thread"""
-        # Optional: sync visual progress with real progress if needed
-        if value > self.visual_progress:
-            self.visual_progress = min(value, 98)
+        self._pending_device_set_hash = device_set_hash
 
-    def on_scan_finished(self):
-        """Called when the scan is finished"""
-        self.scan_completed = True
-        self.scan_button.setEnabled(True)
+        self.scan_button.setEnabled(False)
+
+        # Indeterminate until the scanner reports real progress
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.setVisible(True)
 
-        # Hide progress bar after completion animation
-        QTimer.singleShot(500, lambda: self.progress_bar.setVisible(False))
+        self.scanner.start()
+
+    def on_scan_progress(self, value: int):
+        """Shows the scan progress, switching the bar to determinate mode on the first update"""
+        if self.progress_bar.maximum() == 0:
+            self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(value)
 
     def on_scan_finished(self):
         """Called when the scan is finished"""
@@ -1992,50 +2330,95 @@ class CamRenamerMainWindow(QMainWindow):
 
     def on_cameras_found(self, cameras: List[CameraDevice]):
         """Called when cameras are found"""
+        # Only cache real scan results; an empty result is only trusted if no device is present
+        from_scanner = self.sender() is self.scanner
+        if from_scanner and self.scanner.succeeded() and (cameras or self._pending_device_set_hash == hash(())):
+            self._cached_cameras = list(cameras)
+            self._device_set_hash = self._pending_device_set_hash
+            # Without a device set hash the result cannot be validated, so the TTL shortcut stays off
+            self._cache_time = time.monotonic() if self._device_set_hash is not None else None
+            self._save_cache(cameras)
+
+        # Keep the table, its selection and scroll position if nothing changed
+        if cameras == self.cameras:
+            # A failed scan keeps its error status
+            if not from_scanner or self.scanner.succeeded():
+                self.statusBar().showMessage(f"{len(cameras)} camera(s) found (unchanged)")
+            return
+
         self.cameras = cameras
         self.update_camera_table()
 
+    def _load_cache(self):
+        """Populates the table from the on-disk cache of the last scan in this boot session"""
+        boot_time = get_boot_time()
+        if boot_time is None:
+            return
+
+        try:
+            with open(get_scan_cache_path(), "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if abs(cache["boot_time"] - boot_time) > SCAN_CACHE_BOOT_TOLERANCE:
+                return
+            cameras = [CameraDevice(**camera) for camera in cache["cameras"]]
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        self.cameras = cameras
+        self.update_camera_table()
+        self.statusBar().showMessage(f"{len(cameras)} camera(s) found (cached)")
+
+    def _save_cache(self, cameras: List[CameraDevice]):
+        """Writes the scan result to the on-disk cache"""
+        boot_time = get_boot_time()
+        if boot_time is None:
+            return
+
+        cache_path = get_scan_cache_path()
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "boot_time": boot_time,
+                    "cameras": [asdict(camera) for camera in cameras]
+                }, f)
+        except OSError as e:
+            log.warning("Error saving scan cache: %s", e)
+
+    def showEvent(self, event):
+        """Emits first_shown the first time the window becomes visible"""
+        super().showEvent(event)
+        if not self._shown:
+            self._shown = True
+            self.first_shown.emit()
+
+    def nativeEvent(self, eventType, message):
+        """Invalidates the scan cache when devices change and rescans when a camera comes or goes"""
+        if eventType == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_DEVICECHANGE:
+                # Also drop the hash of a running scan, its result may predate the change
+                self._device_set_hash = None
+                self._pending_device_set_hash = None
+                self._cache_time = None
+                if msg.wParam in (DBT_DEVICEARRIVAL, DBT_DEVICEREMOVECOMPLETE):
+                    self._rescan_timer.start()
+        return super().nativeEvent(eventType, message)
+
+    def _on_device_change_timeout(self):
+        """Rescans after a device change, waits for a running scan or rename to finish first"""
+        if self.scanner.isRunning() or self._rename_in_progress:
+            self._rescan_timer.start()
+        else:
+            self.scan_cameras()
+
     def update_camera_table(self):
-        """Updates the camera table"""
-        self.camera_table.setRowCount(len(self.cameras))
-
-        for row, camera in enumerate(self.cameras):
-            # Name
-            name_item = QTableWidgetItem(camera.friendly_name)
-            name_item.setToolTip(f"Full name: {camera.friendly_name}")
-            name_item.setFlags(name_item.flags() | Qt.ItemFlag.ItemIsSelectable)
-            self.camera_table.setItem(row, 0, name_item)
-
-            # Device ID (shortened)
-            device_id = camera.device_id[:50] + "..." if len(camera.device_id) > 50 else camera.device_id
-            device_item = QTableWidgetItem(device_id)
-            device_item.setToolTip(f"Full Device ID: {camera.device_id}")
-            device_item.setFlags(device_item.flags() | Qt.ItemFlag.ItemIsSelectable)
-            self.camera_table.setItem(row, 1, device_item)
-
-            # Hardware ID (shortened)
-            hardware_id = camera.hardware_id[:30] + "..." if len(camera.hardware_id) > 30 else camera.hardware_id
-            hardware_item = QTableWidgetItem(hardware_id)
-            hardware_item.setToolTip(f"Full Hardware ID: {camera.hardware_id}")
-            hardware_item.setFlags(hardware_item.flags() | Qt.ItemFlag.ItemIsSelectable)
-            self.camera_table.setItem(row, 2, hardware_item)
-
-            # Status
-            status_text = "🟢 Connected" if camera.is_connected else "🔴 Disconnected"
-            status_item = QTableWidgetItem(status_text)
-            status_item.setToolTip(f"Status: {'Active and ready' if camera.is_connected else 'Not available'}")
-            status_item.setFlags(status_item.flags() | Qt.ItemFlag.ItemIsSelectable)
-            self.camera_table.setItem(row, 3, status_item)
-
-            # Actions
-            action_item = QTableWidgetItem("👆 Select to rename")
-            action_item.setToolTip("Click this row to select the camera")
-            action_item.setFlags(action_item.flags() | Qt.ItemFlag.ItemIsSelectable)
-            self.camera_table.setItem(row, 4, action_item)
+        """Updates the camera table, rows of devices that are still present are updated in place"""
+        self.camera_model.merge_cameras(self.cameras)
 
     def rename_selected_camera(self):
         """Renames the selected camera with enhanced registry search dialog"""
-        selected_rows = self.camera_table.selectionModel().selectedRows()
+        selected_rows = self._sel_model.selectedRows()
 
         if not selected_rows:
             QMessageBox.warning(self, "⚠️ Warning", "Please select a camera from the table.")
@@ -2051,8 +2434,7 @@ class CamRenamerMainWindow(QMainWindow):
             QMessageBox.warning(self, "⚠️ Warning", "The name is too long. Maximum 255 characters allowed.")
             return
 
-        row = selected_rows[0].row()
-        camera = self.cameras[row]
+        camera = selected_rows[0].data(Qt.ItemDataRole.UserRole)
 
         if new_name == camera.friendly_name:
             QMessageBox.information(self, "ℹ️ Information", "The new name is identical to the current name.")
@@ -2069,13 +2451,25 @@ class CamRenamerMainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            # The dialogs below run nested event loops, rescans wait until the rename is done
+            self._rename_in_progress = True
+            try:
+                self._rename_camera(camera, new_name)
+            finally:
+                self._rename_in_progress = False
+
+    def _rename_camera(self, camera: CameraDevice, new_name: str):
+        """Searches the registry paths of a camera and writes the new name to them"""
+        # Paths found for this camera by an earlier rename skip the registry search
+        registry_paths = self._registry_paths_cache.get(camera.device_id, [])
+
+        if not registry_paths:
             # Show registry search dialog
             # search_dialog = RegistrySearchDialog(self)
 
             # Create and setup the enhanced registry search thread
             registry_search = EnhancedRegistrySearchThread(camera)
             search_dialog = RegistrySearchDialog(self, registry_search.search_options)
-            registry_paths = []
 
             # Connect signals to the dialog
             def on_progress_updated(value, status):
@@ -2107,38 +2501,51 @@ class CamRenamerMainWindow(QMainWindow):
             if registry_search.isRunning():
                 registry_search.wait()
 
-            # Now proceed with the actual renaming if we found paths
-            if registry_paths:
-                success = self.update_camera_name_in_registry_with_paths(camera, new_name, registry_paths)
-
-                if success:
-                    # Update table
-                    camera.friendly_name = new_name
-                    camera.name = new_name
-                    self.update_camera_table()
-                    self.statusBar().showMessage(f"Camera successfully renamed to: {new_name}")
-                    self.successful_rename_occurred = True
-                else:
-                    QMessageBox.critical(
-                        self, "❌ Error",
-                        "Error renaming the camera!\n\n"
-                        "Possible causes:\n"
-                        "• No administrator rights\n"
-                        "• Camera is currently in use\n"
-                        "• Registry access denied\n\n"
-                        "Try running the application as administrator."
-                    )
-                    self.statusBar().showMessage("Error renaming")
+        # Now proceed with the actual renaming if we found paths
+        if registry_paths:
+            success = self.update_camera_name_in_registry_with_paths(camera, new_name, registry_paths)
+
+            if success:
+                self._registry_paths_cache[camera.device_id] = registry_paths
+
+                # Update table and cached scan with the renamed camera
+                renamed = replace(camera, friendly_name=new_name, name=new_name)
+                # Look the row up again, a scan finishing during the dialogs may have changed the table
+                for row, current in enumerate(self.cameras):
+                    if current.device_id == camera.device_id:
+                        self.cameras[row] = renamed
+                        self.camera_model.update_camera(row, renamed)
+                        break
+                self._cached_cameras = [
+                    renamed if cached.device_id == camera.device_id else cached
+                    for cached in self._cached_cameras
+                ]
+                self._save_cache(self._cached_cameras)
+                self.statusBar().showMessage(f"Camera successfully renamed to: {new_name}")
+                self.successful_rename_occurred = True
             else:
-                QMessageBox.warning(
-                    self, "⚠️ No Registry Paths Found",
-                    f"Could not find any registry entries for camera '{camera.friendly_name}'.\n\n"
-                    "This might happen if:\n"
-                    "• The camera is not properly installed\n"
-                    "• Access to registry is restricted\n"
-                    "• The camera uses a different naming structure\n\n"
-                    "Try running as administrator or check if the camera is properly connected."
+                # Search again next time, the paths may be stale
+                self._registry_paths_cache.pop(camera.device_id, None)
+                QMessageBox.critical(
+                    self, "❌ Error",
+                    "Error renaming the camera!\n\n"
+                    "Possible causes:\n"
+                    "• No administrator rights\n"
+                    "• Camera is currently in use\n"
+                    "• Registry access denied\n\n"
+                    "Try running the application as administrator."
                 )
+                self.statusBar().showMessage("Error renaming")
+        else:
+            QMessageBox.warning(
+                self, "⚠️ No Registry Paths Found",
+                f"Could not find any registry entries for camera '{camera.friendly_name}'.\n\n"
+                "This might happen if:\n"
+                "• The camera is not properly installed\n"
+                "• Access to registry is restricted\n"
+                "• The camera uses a different naming structure\n\n"
+                "Try running as administrator or check if the camera is properly connected."
+            )
 
     def update_camera_name_in_registry_with_paths(self, camera: CameraDevice, new_name: str, registry_paths: List[str]) -> bool:
         """Updates the camera name in the registry using provided paths with threaded backup"""
@@ -2178,71 +2585,54 @@ class CamRenamerMainWindow(QMainWindow):
             self.backup_thread.backup_failed.connect(on_backup_failed)
             self.backup_thread.progress_updated.connect(on_backup_progress)
 
-            # Thread starten und auf Completion warten
+            # Thread starten und in einer lokalen Event-Loop auf Completion warten
+            backup_loop = QEventLoop()
+            self.backup_thread.finished.connect(backup_loop.quit)
             self.backup_thread.start()
-
-            # Event-Loop für Dialog während Backup läuft
-            while self.backup_thread.isRunning():
-                QApplication.processEvents()
-                self.backup_thread.msleep(20)
+            backup_loop.exec()
 
             # Warten bis Thread beendet ist
             self.backup_thread.wait()
             # Final event processing to ensure signal is handled
             QApplication.processEvents()
-            print(backup_path)
+            log.debug("Registry backup: %s", backup_path)
             success_count = 0
+            device_restarted = False
             total_paths = len(registry_paths)
 
-            # Update each registry path
-            for i, registry_path in enumerate(registry_paths):
-                self.statusBar().showMessage(f"Updating registry {i+1}/{total_paths}...")
+            self.statusBar().showMessage(f"Updating {total_paths} registry locations...")
 
-                try:
-                    # Try direct registry access first
-                    with winreg.OpenKey(
-                            winreg.HKEY_LOCAL_MACHINE,
-                            registry_path,
-                            0,
-                            winreg.KEY_SET_VALUE | winreg.KEY_WOW64_64KEY
-                    ) as key:
-                        # Set FriendlyName
-                        winreg.SetValueEx(key, "FriendlyName", 0, winreg.REG_SZ, new_name)
-                        success_count += 1
-
-                except (FileNotFoundError, PermissionError, OSError):
-                    # Try with PowerShell as fallback
-                    try:
-                        powershell_cmd = f"""
-                        $regPath = "HKLM:\\{registry_path}"
-                        if (Test-Path $regPath) {{
-                            try {{
-                                Set-ItemProperty -Path $regPath -Name "FriendlyName" -Value "{new_name}" -Force
-                                Write-Output "SUCCESS"
-                            }} catch {{
-                                Write-Output "ERROR: $($_.Exception.Message)"
-                            }}
-                        }} else {{
-                            Write-Output "PATH_NOT_FOUND"
-                        }}
-                        """
-
-                        result = subprocess.run(
-                            ["powershell", "-ExecutionPolicy", "Bypass", "-Command", powershell_cmd],
-                            startupinfo=startupinfo,
-                            capture_output=True,
-                            text=True,
-                            encoding='utf-8',
-                            errors='replace',
-                            timeout=5
-                        )
-
-                        if result.returncode == 0 and "SUCCESS" in result.stdout:
-                            success_count += 1
-
-                    except Exception:
-                        continue
+            # Write the registry in a thread, the modal dialog blocks input while the UI keeps painting
+            rename_dialog = QProgressDialog(f"Updating {total_paths} registry locations...", "", 0, 0, self)
+            rename_dialog.setWindowTitle("Renaming camera")
+            rename_dialog.setCancelButton(None)
+            rename_dialog.setMinimumDuration(0)
+            rename_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            rename_dialog.show()
+
+            self.rename_thread = RenameThread(self._hklm, camera.device_id, registry_paths, new_name)
 
+            def on_rename_completed(count, restarted):
+                nonlocal success_count, device_restarted
+                success_count = count
+                device_restarted = restarted
+
+            self.rename_thread.rename_completed.connect(on_rename_completed)
+
+            rename_loop = QEventLoop()
+            self.rename_thread.finished.connect(rename_loop.quit)
+            self.rename_thread.start()
+            rename_loop.exec()
+
+            self.rename_thread.wait()
+            # Final event processing to ensure signal is handled
+            QApplication.processEvents()
+            rename_dialog.close()
+
+            if device_restarted:
+                restart_hint = "💡 Applications that already use the camera may need to be restarted to show the new name."
+            else:
+                restart_hint = "💡 A system restart may be required for the changes to take effect in all applications."
 
             # Show backup information if successful
             if success_count > 0 and backup_path:
@@ -2252,183 +2642,96 @@ class CamRenamerMainWindow(QMainWindow):
                     f"Updated {success_count} of {total_paths} registry locations.\n\n"
                     f"💾 Backup created: {os.path.basename(backup_path)}\n"
                     f"📁 Backup folder: {os.path.dirname(backup_path)}\n\n"
-                    "💡 A system restart may be required for the changes "
-                    "to take effect in all applications."
+                    f"{restart_hint}"
                 )
             elif success_count > 0:
                 QMessageBox.information(
                     self, "✅ Partial Success",
                     f"Camera was partially renamed to '{new_name}'!\n\n"
                     f"Updated {success_count} of {total_paths} registry locations.\n\n"
-                    "💡 A system restart may be required for the changes "
-                    "to take effect in all applications."
+                    f"{restart_hint}"
                 )
 
             return success_count > 0
 
-        except Exception as e:
-            print(f"Error during registry update: {e}")
+        except Exception:
+            log.exception("Error during registry update")
             return False
 
-    def create_backup_folder(self):
-        """Creates the backup folder if it doesn't exist"""
-        backup_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "CamRenamer_Backups")
-        os.makedirs(backup_folder, exist_ok=True)
-        return backup_folder
-
-    def create_registry_backup(self, camera: CameraDevice, registry_paths: List[str]) -> str:
-        """Creates a backup .reg file for the camera registry entries - optimized version"""
-        try:
-            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_device_id = camera.device_id.replace("\\", "_").replace("/", "_").replace(":", "_")
-            safe_hardware_id = camera.hardware_id[:20].replace("\\", "_").replace("/", "_").replace(":",
-                                                                                                    "_") if camera.hardware_id else "unknown"
-
-            backup_filename = f"CamRenamer_Backup_{safe_hardware_id}_{safe_device_id}_{timestamp}.reg"
-            backup_folder = self.create_backup_folder()
-            backup_path = os.path.join(backup_folder, backup_filename)
-
-            # Create single PowerShell script that processes all paths at once
-            paths_array = "', '".join([path.replace('"', '').strip() for path in registry_paths])
-
-            powershell_cmd = f"""
-            $paths = @('{paths_array}')
-
-            foreach ($regPath in $paths) {{
-                $fullPath = "HKLM:\\$regPath"
-                if (Test-Path $fullPath) {{
-                    try {{
-                        $key = Get-Item $fullPath -ErrorAction SilentlyContinue
-                        if ($key) {{
-                            Write-Output "[HKEY_LOCAL_MACHINE\\$regPath]"
-
-                            $key.GetValueNames() | ForEach-Object {{
-                                $valueName = $_
-                                $value = $key.GetValue($valueName)
-                                $valueType = $key.GetValueKind($valueName)
-
-                                if ($valueName -eq "") {{
-                                    $regValueName = "@"
-                                }} else {{
-                                    $regValueName = "`"$valueName`""
-                                }}
-
-                                switch ($valueType) {{
-                                    "String" {{
-                                        $escapedValue = $value -replace '\\\\', '\\\\\\\\' -replace '"', '\\"'
-                                        Write-Output "$regValueName=`"$escapedValue`""
-                                    }}
-                                    "DWord" {{
-                                        $hexValue = [System.Convert]::ToString([int]$value, 16).PadLeft(8, '0')
-                                        Write-Output "$regValueName=dword:$hexValue"
-                                    }}
-                                    "QWord" {{
-                                        $hexValue = [System.Convert]::ToString([long]$value, 16).PadLeft(16, '0')
-                                        Write-Output "$regValueName=qword:$hexValue"
-                                    }}
-                                    "Binary" {{
-                                        $hexString = ($value | ForEach-Object {{ [System.Convert]::ToString($_, 16).PadLeft(2, '0') }}) -join ','
-                                        Write-Output "$regValueName=hex:$hexString"
-                                    }}
-                                    "MultiString" {{
-                                        $hexBytes = [System.Text.Encoding]::Unicode.GetBytes(($value -join "`0") + "`0`0")
-                                        $hexString = ($hexBytes | ForEach-Object {{ [System.Convert]::ToString($_, 16).PadLeft(2, '0') }}) -join ','
-                                        Write-Output "$regValueName=hex(7):$hexString"
-                                    }}
-                                    "ExpandString" {{
-                                        $hexBytes = [System.Text.Encoding]::Unicode.GetBytes($value + "`0")
-                                        $hexString = ($hexBytes | ForEach-Object {{ [System.Convert]::ToString($_, 16).PadLeft(2, '0') }}) -join ','
-                                        Write-Output "$regValueName=hex(2):$hexString"
-                                    }}
-                                }}
-                            }}
-                            Write-Output ""
-                        }}
-                    }} catch {{
-                        Write-Output "; Error accessing: $regPath"
-                        Write-Output ""
-                    }}
-                }} else {{
-                    Write-Output "; Registry key not found: $regPath"
-                    Write-Output ""
-                }}
-            }}
-            """
-
-            # Single PowerShell execution for all paths
-            result = subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-Command", powershell_cmd],
-                startupinfo=startupinfo,
-                capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
-                timeout=60
-            )
-
-            # Write to file
-            with open(backup_path, 'w', encoding='utf-16le') as f:
-                f.write('\ufeffWindows Registry Editor Version 5.00\n\n')
-                f.write(f'; CamRenamer Backup created on {datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")}\n')
-                f.write(f'; Camera: {camera.friendly_name}\n')
-                f.write(f'; Device ID: {camera.device_id}\n')
-                f.write(f'; Hardware ID: {camera.hardware_id}\n\n')
-
-                if result.returncode == 0 and result.stdout.strip():
-                    f.write(result.stdout)
-                else:
-                    f.write(f'; Error during backup: {result.stderr}\n')
+    def closeEvent(self, event):
+        """Called when the application is closed"""
+        unregister_device_notification(self._device_notification)
+        self._device_notification = None
+        self._rescan_timer.stop()
 
-            return backup_path
-        except Exception as e:
-            print(f"Error creating backup: {e}")
-            return ""
+        # Stops the scan workers and kills the PowerShell child of a fallback scan
+        if self.scanner.isRunning():
+            self.scanner.cancel()
+            self.scanner.wait(500)
 
-    def update_camera_name_in_registry(self, camera: CameraDevice, new_name: str) -> bool:
-        """Updates the camera name in the registry with optimized threaded search"""
-        try:
-            # Use the optimized registry search thread for backwards compatibility
-            registry_search = RegistrySearchThread(camera)
-            registry_paths = []
+        powershell_host.shutdown()
+        self._hklm.Close()
 
-            # Connect to get results
-            def on_search_completed(paths):
-                nonlocal registry_paths
-                registry_paths = paths
+        # If any successful rename occurred, show the custom exit dialog
+        if self.successful_rename_occurred:
+            dialog = ExitDialog(self)
+            dialog.exec()
 
-            registry_search.search_completed.connect(on_search_completed)
-            registry_search.progress_updated.connect(self.statusBar().showMessage)
+        event.accept()
 
-            # Run synchronously and wait for completion
-            registry_search.start()
-            registry_search.wait()  # Wait for thread to complete
 
-            if not registry_paths:
-                return False
+def render_splash(version: str, device_pixel_ratio: int) -> QPixmap:
+    """Paints the splash screen, the text is laid out once as a single document"""
+    splash_pixmap = QPixmap(SPLASH_WIDTH * device_pixel_ratio, SPLASH_HEIGHT * device_pixel_ratio)
+    splash_pixmap.setDevicePixelRatio(device_pixel_ratio)
+    splash_pixmap.fill(QColor(43, 43, 43))
 
-            # Use the new function with found paths
-            return self.update_camera_name_in_registry_with_paths(camera, new_name, registry_paths)
+    doc = QTextDocument()
+    doc.setDefaultFont(QFont("Arial"))
+    doc.setDocumentMargin(0)
+    doc.setDefaultStyleSheet(SPLASH_STYLESHEET)
+    doc.setHtml(SPLASH_HTML.format(version=version))
+    doc.setTextWidth(SPLASH_WIDTH)
 
-        except Exception as e:
-            print(f"Error during registry update: {e}")
-            return False
+    # Center the laid out document vertically
+    painter = QPainter(splash_pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.translate(0, (SPLASH_HEIGHT - doc.size().height()) / 2)
+    doc.drawContents(painter)
+    painter.end()
+    return splash_pixmap
 
-    def closeEvent(self, event):
-        """Called when the application is closed"""
-        if self.scanner_thread and self.scanner_thread.isRunning():
-            self.scanner_thread.terminate()
-            self.scanner_thread.wait(3000)
 
-        # If any successful rename occurred, show the custom exit dialog
-        if self.successful_rename_occurred:
-            dialog = ExitDialog(self)
-            dialog.exec()
+def load_splash(version: str, device_pixel_ratio: int) -> QPixmap:
+    """Loads the splash rendered on an earlier start, renders and stores it on the first start"""
+    splash_path = get_splash_path(version, device_pixel_ratio)
+    splash_pixmap = QPixmap(splash_path)
+    if not splash_pixmap.isNull():
+        splash_pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return splash_pixmap
 
-        event.accept()
+    splash_pixmap = render_splash(version, device_pixel_ratio)
+    try:
+        os.makedirs(os.path.dirname(splash_path), exist_ok=True)
+    except OSError as e:
+        log.warning("Error saving splash screen: %s", e)
+        return splash_pixmap
+    if not splash_pixmap.save(splash_path, "PNG"):
+        log.warning("Error saving splash screen: %s", splash_path)
+    return splash_pixmap
 
 
 def main():
     """Main function"""
+    logging.basicConfig(format="%(levelname)s %(name)s: %(message)s")
+
+    # Attributes that only take effect before the application object exists
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_CompressHighFrequencyEvents, True)
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_SynthesizeMouseForUnhandledTabletEvents, False)
+    # Qt 6 always scales for high DPI, only the rounding of the scale factor is configurable
+    QApplication.setHighDpiScaleFactorRoundingPolicy(Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+
     app = QApplication(sys.argv)
 
     # Set app properties
@@ -2440,11 +2743,7 @@ def main():
     icon = QIcon(":/img/icon.png")
     app.setWindowIcon(icon)
 
-    # Enable high-DPI support and improve text rendering
-    print("CamRenamer is starting...")
-    #app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling, True)
-    #app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps, True)
-    app.setAttribute(Qt.ApplicationAttribute.AA_SynthesizeMouseForUnhandledTabletEvents, False)
+    log.info("CamRenamer is starting...")
 
     # Set default font with antialiasing
     font = QFont("Segoe UI", 10)
@@ -2452,49 +2751,29 @@ def main():
     font.setStyleStrategy(QFont.StyleStrategy.PreferAntialias)
     app.setFont(font)
 
-    # Splash Screen
-    splash_pixmap = QPixmap(450, 300)
-    splash_pixmap.fill(QColor(43, 43, 43))
-
-    painter = QPainter(splash_pixmap)
-    painter.setPen(QColor(255, 255, 255))
-    painter.setFont(QFont("Arial", 26, QFont.Weight.Bold))
-
-    # Draw title
-    title_rect = splash_pixmap.rect()
-    title_rect.setTop(80)
-    title_rect.setHeight(50)
-    painter.drawText(title_rect, Qt.AlignmentFlag.AlignCenter, "🎥 CamRenamer")
-
-    # Draw subtitle
-    painter.setFont(QFont("Arial", 14))
-    subtitle_rect = splash_pixmap.rect()
-    subtitle_rect.setTop(140)
-    subtitle_rect.setHeight(30)
-    painter.drawText(subtitle_rect, Qt.AlignmentFlag.AlignCenter, "USB Camera Manager v1.1")
-
-    # Draw status
-    painter.setFont(QFont("Arial", 12))
-    status_rect = splash_pixmap.rect()
-    status_rect.setTop(200)
-    status_rect.setHeight(30)
-    painter.drawText(status_rect, Qt.AlignmentFlag.AlignCenter, "Loading...")
+    # Splash Screen, rendered once per version and pixel ratio and then loaded from
+    # disk. Skipped when the last start-up was fast enough that it would only flash on screen.
+    settings = QSettings()
+    last_startup_ms = settings.value("startup/last_duration_ms", SPLASH_MIN_STARTUP_MS, type=int)
 
-    painter.end()
-
-    splash = QSplashScreen(splash_pixmap)
-    splash.show()
-
-    # Short wait for splash
-    for i in range(10):
-        time.sleep(0.1)
+    splash = None
+    if last_startup_ms >= SPLASH_MIN_STARTUP_MS:
+        device_pixel_ratio = 2 if app.devicePixelRatio() > 1 else 1
+        splash = QSplashScreen(load_splash(app.applicationVersion(), device_pixel_ratio))
+        splash.show()
         app.processEvents()
 
-    # Create main window
+    # Create main window, the splash closes as soon as it is shown
+    startup_timer = QElapsedTimer()
+    startup_timer.start()
     window = CamRenamerMainWindow()
 
-    # Close splash and show main window
-    splash.finish(window)
+    def on_first_shown():
+        settings.setValue("startup/last_duration_ms", startup_timer.elapsed())
+        if splash:
+            splash.finish(window)
+
+    window.first_shown.connect(on_first_shown, Qt.ConnectionType.QueuedConnection)
     window.show()
 
     return app.exec()
@@ -1,11 +1,74 @@
 # Resource object code (Python 3)
 # Created by: object code
-# Created by: The Resource Compiler for Qt version 6.10.0
+# Created by: The Resource Compiler for Qt version 6.12.0
 # WARNING! All changes made in this file will be lost!
 
 from PySide6 import QtCore
 
 qt_resource_data = b"\
+\x00\x00\x03\xc6\
+(\
+\xb5/\xfd`@\x15\xe5\x1d\x00F\x9fZ\x22\x10q\xdc\
+p\xb0\xfeR\xb2%\xa3\x12\xebN\x22\x19\xf1pl\xe8\
+>\xa4\x02!I\xd5\xbf\xfe\x0eF\x04\x00\x80\xc8AR\
+\x00P\x00N\x00\x10\x04\x95\xc3\xdbZB\x12\xfdUj\
+\xd1Ov}\x97\x8c.\x08i\xa0p\xef3u\xfa\x94\
+\xd7\xb5u\xe7\x01\x80m]?\x9c \x02T\xae\xcd{\
+\xb1\x02\xdd\x0au+)$\x1c\x8e\x0dGB\x93\xb0\x18\
+\x00T\xde\xae\x99\xd28jw.X.tLP\xea\
+\xc6k\xc1\x9b\x10\x12\x01\xbc\x0fy\xe0V\xbemm\x81\
+d\xd3\xf7\xd4!\xa6Yr=\x96\xe7\xdbJ\x0a\xaf\xe4\
+\x00\xd5\x8b\xb6\xe5\x04-\x0c>/\x8a\xe0\xfe\x8f\x22\xae\
+\xec\xad`\xe0\x8a\xd1\x8fR\x8d}\xcd\xf5RIy\xee\
+\xe6\x1fg]\xb9y\x82\x18\x82\xe7\xdaR\x1d\xf4\xf7\x91\
+\x9a*I\xff\xf7R\xa6\xea\x9c\xfe,\xa1\xe7\xba)\xa2\
+\xcf\x9f\xb8\xe0\xe8aJ\xb9>+C\xc5\xce\xbaT~\
+\xd2\x9f\xa0g\xe4=u\xa7}\xf9F\x9dZo\xc5\xb5\
+?7[\xd1S\xf7\xfbJ\x15<\x14\xeaWx\x1dO\
+\x09d\x82SG\xa0\x86\x09:]\xf9\x98\xe0\x8bX7\
+\x8a\xf9m\x0c\x1aL\xbd\x87\xac*\xbd.|u\x1eg\
+\xfd\xb95\xd6\xfbq\x12b\xa9\x9b\xd4\xee\xa9@\x91\x00\
+\xafS\x98G]\xe3|\x14*\x97l\xdf\x15c \x00\
+U\xa2\x0f\x05^x.\xa0w\x83O]\xc6O,\xe7\
+\xda\xd9\x04\x06\x0c8\xedr\x17\x16&b\x85\x98\xa0\x05\
+\xe2R\xe2\xcd\xcf\x01\x80\xf8\xa8A\x1e\x91\x12\x9a\x91\x82\
+$\x85\xc6 \x84\x10\x82\x18\xb3\xaa\x03r0\x10\x8e\x84\
+ \x04\xc1\x10\x12A(\x04\x22`\x11\x01\x91\x84\x10B\
+\x0c!\x96\x94\x04T\xe2t#\x91\x05\xe2\xd0\xd8g3\
+\xd6\xb62\xeb\xee\xbb\xa8u\x0f\xa9\xd5\xee\x1c\x06o.\
+\x08/\x0c6\x02\xc8\xe8g\xe0_\xda\x99B\xad\x95I\
+i\x0b\xd3\x8a\xc4[\xc5\xea\xa5]U\xab\x09\xd61\xa9\
+F:>\xa8Tx\x7f\xd2T/\xaa\x03\xaf\xa8PI\
+\xab\x00\x15 \xb6\x0d\xd2ZHq\x08\x16:\xd60\xc1\
+n\x81\xe0\xd7\x08\x05\xf3\xc2,\xb1\xc1%\x891\xcb\xe1\
+\x9eN)H\x8b\x10SZ\xca\xc0\xb0j8\xa0E\xee\
+XP\xa3\xba\xad&y\x8d\x8c\x0d\x88\x80\x92\xd3#t\
+\xdf\xd1\xda\xbe\xf4\x84\xf0y\xbd\xc9\x8e\xef\xe6G\x9b9\
+\x0b\x11\x93\xd1\x97\x17x\xaf\x08\x93\xc1\xad\x80+\x09\x15\
+\x18\x12\xb6\xaa6-%\x90\xd3\xfb\xc2\x0b\x11\x00\xb0a\
+\x19\x9e#\x0e\xcf^\x11_\xa8\xe0T\x16BZ\x9e!\
+\x95\xebe7V\xc8\x09\x8bn\xdf\xc3\x9av\x90SV\
+\x1f \x9apx\x8d1\xf6\xc4u{gR\xfd\xbf9\
+\x9e\xa6 \xc7A\xf9\x9bF?\x09\x96\xd4\xe8\xb6m\xa3\
+\xf4\x135Gp\xae\xb0\x91\xcfVo\x94\xad(\xba\x9b\
+?E\xd4\x8dJ(o\xd5\xda{3\xe7o\xad\xc7V\
+<\x12\x1eJ\x02\xffD\xe4Z\xd6d\xa9\x8d\xe2\xba\xb4\
+\x05\xe5\x80Oz\xab0:|\x1b\xfa\x93:b\xf1\xba\
+\xfd\x8bO\x8d\x90@\x06\xcf\x99\x89\xf7\x99kqvN\
+m\xc9CM9n?\x80d\x82(\x87\xc6\x87M\x04\
+\xfca \xf5\xa0\xec\x88\x84-a\xd0\xd97\x92\xefK\
+e\xf8u\xa9\xb8\x92\xa6lp\x10\xc4\xd1\xb2\x10\xdd\xf2\
+s\xd3\xbe\xc6d\xe6\xb3\xb5];[)\xe29A\xd6\
+$7D\x15\xb7\xb5\x08U\x1ck\xac\xfb\x96x\xe6\xd7\
+\x16\xaf}8\xc9gG\xb1\xbd\x9eE\xdf\xb6x\x06t\
+e\xf2\xeb\x12\x03\x1a\xf7KA\xf7\xa1N\x0d\xa9e\xe3\
+\x18\xfdD\x0b%\x1b\xbb&d\xf6\x5c\xd8\x90z\xde\xb8\
+b\xaa\xd2\xba!\x94\xa2\x10\xaa\xa7^\xb4\xd6B\x8e*\
+a\xa7\x80\x16|\x92\xfb\xc3\xa5lh\xea\xf3h\xc4\xed\
+\x12M\xce, \xa2l<\x88\x9a\xf7h3K]\xdb\
+s1l\xb2\xf3@<\x9e#\x14\xec\x81A\xf1CB\
+A\xc3K\x80ry=\x1a\x06%\xee:\xfe'B\x84\
+sR\xfd\x00*\
 \x00\x00\xfd\xd4\
 \x00\
 \x00\x01\x00\x01\x00\x00\x00\x00\x00\x01\x00 \x00\xbe\xfd\x00\
@@ -87764,6 +87827,10 @@ ef\xb8\x1e8E\xd6\xf1(\x0co2\x1a\x19\xba\x89\
 "
 
 qt_resource_name = b"\
+\x00\x0a\
+\x02\xcd\x00\xa3\
+\x00s\
+\x00t\x00y\x00l\x00e\x00s\x00.\x00q\x00s\x00s\
 \x00\x03\
 \x00\x00p7\
 \x00i\
@@ -87779,14 +87846,16 @@ qt_resource_name = b"\
 "
 
 qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
+\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
 \x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0c\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9a\x16l,g\
-\x00\x00\x00\x22\x00\x00\x00\x00\x00\x01\x00\x00\xfd\xd8\
-\x00\x00\x01\x9a\x033:\xf6\
+\x00\x00\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1A\xdf\x00\x80\
+\x00\x00\x00&\x00\x00\x00\x00\x00\x01\x00\x00\x03\xca\
+\x00\x00\x01\x9a&%\xae8\
+\x00\x00\x00<\x00\x00\x00\x00\x00\x01\x00\x01\x01\xa2\
+\x00\x00\x01\x9a&%\xae8\
 "
 
 def qInitResources():